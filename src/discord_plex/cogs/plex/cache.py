@@ -1,6 +1,14 @@
 import asyncio
+import functools
+import heapq
 import logging
-from datetime import datetime, timedelta
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from typing import TypedDict
 
 from rapidfuzz import fuzz, process
@@ -10,6 +18,18 @@ from .plex_client import PlexClientWrapper
 
 logger = logging.getLogger(__name__)
 
+# Fraction of trigrams a title must share with the query to be fuzzy scored at all.
+# One typo removes up to three padded trigrams, so short words need a low bar.
+_TRIGRAM_MIN_SHARE = 0.25
+# Upper bound on shortlisted titles handed to rapidfuzz per search
+_TRIGRAM_MAX_CANDIDATES = 500
+
+# Cap on how many refresh intervals the background loop waits after repeated failures
+_MAX_BACKOFF_FACTOR = 8
+
+# "title 2021" or "title (2021)" at the end of a normalized query
+_TRAILING_YEAR_RE = re.compile(r"^(?P<title>.+?)\s+\(?(?P<year>(?:19|20)\d{2})\)?$")
+
 
 class CacheStats(TypedDict):
     """Structured statistics returned by :meth:`LibraryCache.get_stats`."""
@@ -21,29 +41,262 @@ class CacheStats(TypedDict):
     is_stale: bool
 
 
+def _normalize_title(title: str) -> str:
+    """Normalize title for indexing."""
+    return title.lower().strip()
+
+
+def _token_key(normalized: str) -> str:
+    """Reduce a normalized title to its sorted unique tokens.
+
+    token_set_ratio only looks at the token set, so scoring against this form gives
+    the same result while letting titles that differ only in word order or spacing
+    share one index entry.
+    """
+    return " ".join(sorted(set(normalized.split())))
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return the character trigrams of each space-padded token in ``text``.
+
+    Trigrams never span two words, so they do not depend on word order.
+    """
+    trigrams: set[str] = set()
+    for token in text.split():
+        padded = f" {token} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class _CacheSnapshot:
+    """One refresh's items, their indexes and its search memo.
+
+    Never modified after construction. LibraryCache swaps in a new snapshot with a
+    single assignment and every reader takes it once, so a search running in a worker
+    thread can't mix indexes from two refreshes or memoize an old result into the new
+    snapshot's LRU.
+    """
+
+    def __init__(self, cache: dict[str, CachedMedia]):
+        items = list(cache.values())
+
+        # Build the title index in one pass, then freeze the postings to tuples
+        title_postings: defaultdict[str, list[str]] = defaultdict(list)
+        title_keys: dict[str, str] = {}
+        for item in items:
+            title_key = _token_key(_normalize_title(item.title))
+            title_postings[title_key].append(item.rating_key)
+            title_keys[item.rating_key] = title_key
+        title_index = {key: tuple(keys) for key, keys in title_postings.items()}
+        titles_list = list(title_index)
+
+        # Character-trigram postings used to shortlist titles before fuzzy scoring
+        trigram_postings: defaultdict[str, list[int]] = defaultdict(list)
+        trigram_counts: list[int] = []
+        for position, title_key in enumerate(titles_list):
+            trigrams = _trigrams(title_key)
+            for trigram in trigrams:
+                trigram_postings[trigram].append(position)
+            trigram_counts.append(len(trigrams))
+
+        # plexapi 4.18.1 makes datetime attributes timezone-aware when the optional
+        # timezone is enabled, so added_at can be a mix of tz-aware and naive (or None)
+        # values. Sort on the precomputed POSIX timestamp to sidestep naive/aware
+        # comparison entirely (which would raise TypeError); missing added_at is -1,
+        # so it sorts oldest. Same bug class as the v1.4.0 embeds fix.
+        by_added_at = sorted(items, key=attrgetter("added_ts"), reverse=True)
+
+        # Inverted indexes for the library/type filters, kept newest first
+        by_library: dict[str, list[str]] = {}
+        by_type: dict[MediaType, list[str]] = {}
+        by_library_type: dict[tuple[str, MediaType], list[str]] = {}
+        for item in by_added_at:
+            library_key = item.library.lower()
+            by_library.setdefault(library_key, []).append(item.rating_key)
+            by_type.setdefault(item.media_type, []).append(item.rating_key)
+            by_library_type.setdefault((library_key, item.media_type), []).append(item.rating_key)
+
+        # Summary data only changes with the cache, so compute it here rather than per call
+        library_counts = dict(Counter(item.library for item in items))
+
+        self.cache = cache  # rating_key -> CachedMedia
+        self.title_index = title_index  # title token key -> rating_keys
+        self.title_keys = title_keys  # rating_key -> title token key
+        self.titles_list = titles_list  # rapidfuzz choices
+        self.trigram_index = dict(trigram_postings)  # trigram -> titles_list positions
+        self.trigram_counts = trigram_counts  # distinct trigrams per titles_list entry
+        self.by_added_at = by_added_at  # newest first
+        self.by_library = by_library  # library.lower() -> [rating_keys]
+        self.by_type = by_type  # media_type -> [rating_keys]
+        # (library.lower(), media_type) -> [rating_keys]
+        self.by_library_type = by_library_type
+        self.type_counts = dict(Counter(item.media_type.value for item in items))
+        self.library_counts = library_counts
+        self.libraries = sorted(library_counts)  # sorted library names
+        # Repeated queries (re-issued commands, paging back) hit this LRU. It lives
+        # and dies with the snapshot, so a refresh never has to clear it.
+        self.search = functools.lru_cache(maxsize=256)(self._search_uncached)
+
+    def filter_keys(
+        self,
+        media_type: MediaType | None = None,
+        library: str | None = None,
+    ) -> list[str]:
+        """Return rating keys matching the filters, newest first."""
+        if library and media_type:
+            return self.by_library_type.get((library.lower(), media_type), [])
+        if library:
+            return self.by_library.get(library.lower(), [])
+        if media_type:
+            return self.by_type.get(media_type, [])
+        return [item.rating_key for item in self.by_added_at]
+
+    def trigram_candidates(self, normalized_query: str) -> list[int] | None:
+        """Return ``titles_list`` positions sharing enough trigrams with the query.
+
+        Returns None when the query has no trigrams, meaning every title is a candidate.
+        """
+        query_trigrams = _trigrams(normalized_query)
+        if not query_trigrams:
+            return None
+
+        trigram_index = self.trigram_index
+        counts = Counter(
+            chain.from_iterable(trigram_index.get(trigram, ()) for trigram in query_trigrams)
+        )
+        # Measure the share against the shorter side: token_set_ratio scores a title
+        # whose words are a subset of the query (or vice versa) as a full match
+        query_count = len(query_trigrams)
+        title_counts = self.trigram_counts
+        shares: dict[int, float] = {}
+        for position, shared in counts.items():
+            smaller = min(query_count, title_counts[position])
+            if shared >= math.ceil(smaller * _TRIGRAM_MIN_SHARE):
+                shares[position] = shared / smaller
+        # Very common trigrams ("the") can still shortlist much of the library, so
+        # only fuzzy score the best-overlapping titles
+        if len(shares) > _TRIGRAM_MAX_CANDIDATES:
+            return sorted(heapq.nlargest(_TRIGRAM_MAX_CANDIDATES, shares, key=shares.__getitem__))
+        return sorted(shares)
+
+    def _search_uncached(
+        self,
+        normalized_query: str,
+        limit: int,
+        media_type: MediaType | None,
+        library: str | None,
+    ) -> tuple[CachedMedia, ...]:
+        """Run a fuzzy search for an already-normalized query and library name."""
+        # A trailing year ("dune 2021") ranks items from that year first instead of
+        # being matched as a title word
+        year: int | None = None
+        year_match = _TRAILING_YEAR_RE.match(normalized_query)
+        if year_match:
+            normalized_query = year_match.group("title")
+            year = int(year_match.group("year"))
+        normalized_query = _token_key(normalized_query)
+
+        # Block on shared trigrams first so rapidfuzz only scores a shortlist
+        candidates = self.trigram_candidates(normalized_query)
+        all_titles = self.titles_list
+
+        allowed_keys: set[str] | None = None
+        if media_type or library:
+            # Only score titles belonging to items that can pass the filters
+            filtered_keys = self.filter_keys(media_type, library)
+            allowed_keys = set(filtered_keys)
+            title_keys = self.title_keys
+            titles = list(dict.fromkeys(title_keys[rating_key] for rating_key in filtered_keys))
+            if candidates is not None:
+                candidate_titles = {all_titles[position] for position in candidates}
+                titles = [title for title in titles if title in candidate_titles]
+        elif candidates is not None:
+            titles = [all_titles[position] for position in candidates]
+        else:
+            titles = all_titles
+
+        # Use rapidfuzz to find best matches
+        # token_set_ratio handles partial matches well (e.g., "jujutsu" matches "jujutsu kaisen")
+        # Higher threshold (70) for tighter matching - prevents unrelated results. Passing it
+        # as score_cutoff lets rapidfuzz discard candidates inside the C extension.
+        # The filters are already pushed into ``titles``, so every title scored has at
+        # least one allowed item and ``limit`` titles are enough; a year query asks for
+        # extra so it has same-year items to promote.
+        matches = process.extract(
+            normalized_query,
+            titles,
+            scorer=fuzz.token_set_ratio,
+            processor=None,  # Titles and query are already normalized
+            limit=limit if year is None else limit * 2,
+            score_cutoff=70,
+        )
+
+        # Hoist lookups out of the loop; matches arrive sorted by score descending,
+        # so results stay in relevance order and we can stop once we have enough
+        # (a year query needs every candidate before it can reorder them)
+        collect_limit = limit if year is None else len(self.cache)
+        title_index_get = self.title_index.get
+        cache_get = self.cache.get
+        final_results: list[CachedMedia] = []
+        seen_keys: set[str] = set()
+        seen_add = seen_keys.add
+
+        for title, _score, _ in matches:
+            for rating_key in title_index_get(title, ()):
+                if rating_key in seen_keys:
+                    continue
+
+                # A title key can be shared by items outside the filters
+                if allowed_keys is not None and rating_key not in allowed_keys:
+                    continue
+
+                item = cache_get(rating_key)
+                if not item:
+                    continue
+
+                seen_add(rating_key)
+                final_results.append(item)
+                if len(final_results) >= collect_limit:
+                    break
+            if len(final_results) >= collect_limit:
+                break
+
+        if year is not None:
+            # Stable sort keeps relevance order within each group. Titles that contain
+            # the year ("blade runner 2049") count as a match too.
+            year_token = str(year)
+            final_results.sort(
+                key=lambda item: item.year != year and year_token not in item.title.split()
+            )
+            final_results = final_results[:limit]
+
+        return tuple(final_results)
+
+
 class LibraryCache:
     """In-memory cache of Plex library with fuzzy search capabilities."""
 
     def __init__(self, plex_client: PlexClientWrapper, refresh_minutes: int = 30):
         self.plex_client = plex_client
         self.refresh_minutes = refresh_minutes
-        self._cache: dict[str, CachedMedia] = {}  # rating_key -> CachedMedia
-        self._title_index: dict[str, list[str]] = {}  # normalized_title -> [rating_keys]
-        self._last_refresh: datetime | None = None
-        self._refresh_lock = asyncio.Lock()
+        # Items and indexes from the last refresh, replaced wholesale by the next one
+        self._snapshot = _CacheSnapshot({})
+        self._last_refresh: datetime | None = None  # wall clock, for display only
+        self._last_refresh_mono: float | None = None  # time.monotonic() of last refresh
+        self._refresh_inflight: asyncio.Task | None = None  # refresh in progress, if any
         self._refresh_task: asyncio.Task | None = None
 
     @property
     def is_stale(self) -> bool:
         """Check if cache needs refresh."""
-        if self._last_refresh is None:
+        if self._last_refresh_mono is None:
             return True
-        return datetime.now() - self._last_refresh > timedelta(minutes=self.refresh_minutes)
+        return time.monotonic() - self._last_refresh_mono > self.refresh_minutes * 60
 
     @property
     def item_count(self) -> int:
         """Get number of cached items."""
-        return len(self._cache)
+        return len(self._snapshot.cache)
 
     async def start_background_refresh(self) -> None:
         """Start periodic background refresh task."""
@@ -51,16 +304,28 @@ class LibraryCache:
             return
 
         async def refresh_loop() -> None:
-            while True:
-                try:
-                    await self.refresh()
-                    await asyncio.sleep(self.refresh_minutes * 60)
-                except asyncio.CancelledError:
-                    logger.debug("Background cache refresh loop cancelled")
-                    raise
-                except Exception as e:
-                    logger.error(f"Background cache refresh error: {e}")
-                    await asyncio.sleep(self.refresh_minutes * 60)
+            loop = asyncio.get_running_loop()
+            failures = 0
+            try:
+                while True:
+                    interval = self.refresh_minutes * 60
+                    # Measure from the start of the refresh so its duration doesn't
+                    # drift the schedule
+                    deadline = loop.time() + interval
+                    try:
+                        await self.refresh()
+                        failures = 0
+                    except Exception as e:
+                        failures += 1
+                        logger.error(f"Background cache refresh error: {e}")
+                        # Back off on consecutive failures rather than retrying a down
+                        # Plex server at the normal rate
+                        backoff = min(2 ** (failures - 1), _MAX_BACKOFF_FACTOR)
+                        deadline += interval * (backoff - 1)
+                    await asyncio.sleep(max(1.0, deadline - loop.time()))
+            except asyncio.CancelledError:
+                logger.debug("Background cache refresh loop cancelled")
+                raise
 
         self._refresh_task = asyncio.create_task(refresh_loop())
         logger.info("Started background cache refresh task")
@@ -90,74 +355,70 @@ class LibraryCache:
             logger.info("Stopped background cache refresh task")
 
     async def refresh(self) -> None:
-        """Refresh the cache from Plex."""
-        async with self._refresh_lock:
-            logger.info("Refreshing library cache...")
-            start_time = datetime.now()
+        """Refresh the cache from Plex.
 
-            try:
-                # Run blocking Plex API call in executor
-                loop = asyncio.get_event_loop()
-                media_items = await loop.run_in_executor(
-                    None,
-                    self.plex_client.get_all_media,
-                )
-
-                # Track changes for logging
-                old_keys = set(self._cache.keys())
-
-                # Clear and rebuild cache
-                self._cache.clear()
-                self._title_index.clear()
-
-                for item in media_items:
-                    self._cache[item.rating_key] = item
-                    self._index_title(item)
-
-                self._last_refresh = datetime.now()
-                elapsed = (datetime.now() - start_time).total_seconds()
-
-                # Log cache changes
-                new_keys = set(self._cache.keys())
-                added = new_keys - old_keys
-                removed = old_keys - new_keys
-
-                logger.info(
-                    f"Cache refreshed: {len(self._cache)} items in {elapsed:.2f}s "
-                    f"(+{len(added)} added, -{len(removed)} removed)"
-                )
-
-                if added:
-                    logger.debug(f"New items added: {len(added)}")
-                if removed:
-                    logger.debug(f"Items removed: {len(removed)}")
-
-            except Exception as e:
-                logger.error(f"Failed to refresh cache: {e}")
-                raise
+        Concurrent callers share the refresh already in flight instead of queueing
+        another one behind it.
+        """
+        task = self._refresh_inflight
+        if task is None:
+            task = asyncio.create_task(self._refresh())
+            self._refresh_inflight = task
+            task.add_done_callback(self._clear_refresh_inflight)
+        # Shield so one cancelled caller doesn't abort the refresh for the others
+        await asyncio.shield(task)
+
+    def _clear_refresh_inflight(self, task: asyncio.Task) -> None:
+        if self._refresh_inflight is task:
+            self._refresh_inflight = None
+        # _refresh already logged any failure; mark it retrieved in case every
+        # caller was cancelled before it finished
+        if not task.cancelled():
+            task.exception()
+
+    async def _refresh(self) -> None:
+        """Fetch every item from Plex and swap in the rebuilt cache."""
+        logger.info("Refreshing library cache...")
+        start_time = time.monotonic()
 
-    def _index_title(self, item: CachedMedia) -> None:
-        """Add item to title index for fuzzy search."""
-        normalized = self._normalize_title(item.title)
-        if normalized not in self._title_index:
-            self._title_index[normalized] = []
-        self._title_index[normalized].append(item.rating_key)
-
-        # Also index with year appended
-        if item.year:
-            with_year = f"{normalized} {item.year}"
-            if with_year not in self._title_index:
-                self._title_index[with_year] = []
-            self._title_index[with_year].append(item.rating_key)
-
-    @staticmethod
-    def _normalize_title(title: str) -> str:
-        """Normalize title for indexing."""
-        return title.lower().strip()
+        try:
+            # Run blocking Plex API call in a worker thread
+            media_items = await asyncio.to_thread(self.plex_client.get_all_media)
+
+            # Build the new cache and indexes off to the side, then swap them in
+            # so readers never see a half-built cache. Indexing a large library
+            # takes long enough to stall the gateway, so it runs in a worker thread;
+            # only the swap itself happens on the event loop.
+            old_keys = self._snapshot.cache.keys()
+            new_cache = {item.rating_key: item for item in media_items}
+            self._snapshot = await asyncio.to_thread(_CacheSnapshot, new_cache)
+
+            self._last_refresh = datetime.now()
+            self._last_refresh_mono = time.monotonic()
+            elapsed = self._last_refresh_mono - start_time
+
+            # Log cache changes
+            new_keys = new_cache.keys()
+            added = new_keys - old_keys
+            removed = old_keys - new_keys
+
+            logger.info(
+                f"Cache refreshed: {len(new_cache)} items in {elapsed:.2f}s "
+                f"(+{len(added)} added, -{len(removed)} removed)"
+            )
+
+            if added:
+                logger.debug(f"New items added: {len(added)}")
+            if removed:
+                logger.debug(f"Items removed: {len(removed)}")
+
+        except Exception as e:
+            logger.error(f"Failed to refresh cache: {e}")
+            raise
 
     def get_by_key(self, rating_key: str) -> CachedMedia | None:
         """Get item by rating key."""
-        return self._cache.get(rating_key)
+        return self._snapshot.cache.get(rating_key)
 
     def search(
         self,
@@ -178,55 +439,22 @@ class LibraryCache:
         Returns:
             List of matching CachedMedia sorted by relevance
         """
-        if not self._cache:
+        # Read the snapshot once so a refresh landing mid-search can't mix indexes
+        snapshot = self._snapshot
+        if not snapshot.cache:
             logger.debug(f"Cache search '{query}': cache empty")
             return []
 
-        normalized_query = self._normalize_title(query)
         logger.debug(f"Cache search: query='{query}', type={media_type}, library={library}")
 
-        # Get all titles for fuzzy matching
-        titles = list(self._title_index.keys())
-
-        # Use rapidfuzz to find best matches
-        # token_set_ratio handles partial matches well (e.g., "jujutsu" matches "jujutsu kaisen")
-        matches = process.extract(
-            normalized_query,
-            titles,
-            scorer=fuzz.token_set_ratio,
-            limit=limit * 2,  # Get extra to account for filtering
+        final_results = list(
+            snapshot.search(
+                _normalize_title(query),
+                limit,
+                media_type,
+                library.lower() if library else None,
+            )
         )
-
-        results = []
-        seen_keys = set()
-
-        for title, score, _ in matches:
-            # Higher threshold (70) for tighter matching - prevents unrelated results
-            if score < 70:
-                continue
-
-            rating_keys = self._title_index.get(title, [])
-            for rating_key in rating_keys:
-                if rating_key in seen_keys:
-                    continue
-
-                item = self._cache.get(rating_key)
-                if not item:
-                    continue
-
-                # Apply filters
-                if media_type and item.media_type != media_type:
-                    continue
-                if library and item.library.lower() != library.lower():
-                    continue
-
-                seen_keys.add(rating_key)
-                results.append((score, item))
-
-        # Sort by score descending
-        results.sort(key=lambda x: x[0], reverse=True)
-
-        final_results = [item for _, item in results[:limit]]
         logger.debug(f"Cache search '{query}': found {len(final_results)} results")
         return final_results
 
@@ -236,30 +464,17 @@ class LibraryCache:
         library: str | None = None,
     ) -> list[CachedMedia]:
         """Get recently added items from cache."""
-        items = list(self._cache.values())
+        snapshot = self._snapshot
+        if not library:
+            return snapshot.by_added_at[:limit]
 
-        # Filter by library if specified
-        if library:
-            items = [i for i in items if i.library.lower() == library.lower()]
-
-        # Sort by added_at descending. plexapi 4.18.1 makes datetime attributes
-        # timezone-aware when the optional timezone is enabled, so added_at can be a
-        # mix of tz-aware and naive (or None) values. Compare on the POSIX timestamp
-        # to sidestep naive/aware comparison entirely (which would raise TypeError),
-        # treating missing added_at as oldest. Same bug class as the v1.4.0 embeds fix.
-        items.sort(
-            key=lambda x: x.added_at.timestamp() if x.added_at else float("-inf"),
-            reverse=True,
-        )
-
-        return items[:limit]
+        # The library index is already newest first
+        keys = snapshot.by_library.get(library.lower(), [])[:limit]
+        return [snapshot.cache[key] for key in keys]
 
     def get_libraries(self) -> list[str]:
         """Get unique library names from cache."""
-        libraries = set()
-        for item in self._cache.values():
-            libraries.add(item.library)
-        return sorted(libraries)
+        return list(self._snapshot.libraries)
 
     def get_all(
         self,
@@ -267,32 +482,19 @@ class LibraryCache:
         library: str | None = None,
     ) -> list[CachedMedia]:
         """Get all items, optionally filtered."""
-        items = list(self._cache.values())
+        snapshot = self._snapshot
+        if not media_type and not library:
+            return list(snapshot.cache.values())
 
-        if media_type:
-            items = [i for i in items if i.media_type == media_type]
-        if library:
-            items = [i for i in items if i.library.lower() == library.lower()]
-
-        return items
+        return [snapshot.cache[key] for key in snapshot.filter_keys(media_type, library)]
 
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
-        type_counts: dict[str, int] = {}
-        library_counts: dict[str, int] = {}
-
-        for item in self._cache.values():
-            # Count by type
-            type_name = item.media_type.value
-            type_counts[type_name] = type_counts.get(type_name, 0) + 1
-
-            # Count by library
-            library_counts[item.library] = library_counts.get(item.library, 0) + 1
-
+        snapshot = self._snapshot
         return {
-            "total_items": len(self._cache),
-            "by_type": type_counts,
-            "by_library": library_counts,
+            "total_items": len(snapshot.cache),
+            "by_type": dict(snapshot.type_counts),
+            "by_library": dict(snapshot.library_counts),
             "last_refresh": (self._last_refresh.isoformat() if self._last_refresh else None),
             "is_stale": self.is_stale,
         }
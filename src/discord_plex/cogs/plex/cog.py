@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import cast
+from collections.abc import Hashable
+from typing import Any, cast
 
 import discord
 from discord import ApplicationContext, Bot, Embed, Interaction, Member, option
@@ -71,6 +72,13 @@ class PlexCog(commands.Cog):
         self.cache = LibraryCache(self.plex_client, CACHE_REFRESH_MINUTES)
         self._shutdown_task: asyncio.Task[None] | None = None
 
+        # Slow-changing Plex results served by /plex recent and /plex stats:
+        # key -> (value, time.monotonic() expiry), plus their in-flight refreshes
+        self._snapshots: dict[Hashable, tuple[Any, float]] = {}
+        self._snapshot_refreshes: dict[Hashable, asyncio.Task[None]] = {}
+        # In-flight /plex search and /request search lookups, shared by identical queries
+        self._search_inflight: dict[Hashable, asyncio.Task[Any]] = {}
+
     async def cog_before_invoke(self, ctx) -> None:
         """Bind a fresh request id on every slash-command entry into this cog."""
         bind_request_id()
@@ -89,7 +97,10 @@ class PlexCog(commands.Cog):
     async def shutdown(self) -> None:
         """Gracefully stop background tasks and close clients."""
         await self.cache.shutdown()
+        for task in list(self._snapshot_refreshes.values()):
+            task.cancel()
         await self.overseerr_client.close()
+        self.plex_client.close()
         self.logger.info("PlexCog shutdown complete")
 
     def cog_unload(self) -> None:
@@ -389,17 +400,8 @@ class PlexCog(commands.Cog):
 
     # ==================== Error Handlers ====================
 
-    @plex_search.error  # pyright: ignore[reportFunctionMemberAccess]
-    @plex_playing.error  # pyright: ignore[reportFunctionMemberAccess]
-    @plex_recent.error  # pyright: ignore[reportFunctionMemberAccess]
-    @plex_stats.error  # pyright: ignore[reportFunctionMemberAccess]
-    @request_search.error  # pyright: ignore[reportFunctionMemberAccess]
-    @request_status.error  # pyright: ignore[reportFunctionMemberAccess]
-    @request_queue.error  # pyright: ignore[reportFunctionMemberAccess]
-    @request_approve.error  # pyright: ignore[reportFunctionMemberAccess]
-    @request_deny.error  # pyright: ignore[reportFunctionMemberAccess]
-    async def command_error(self, ctx: ApplicationContext, error: Exception) -> None:
-        """Handle command errors."""
+    async def cog_command_error(self, ctx: ApplicationContext, error: Exception) -> None:
+        """Handle errors from every command in this cog."""
         if isinstance(error, commands.CheckFailure):
             await ctx.respond(
                 embed=create_error_embed("You don't have permission to use this command."),
@@ -1,7 +1,9 @@
-from datetime import datetime
+import heapq
+import time
 
 from discord import Colour, Embed
 
+from ...util import format_year_suffix
 from .cache import CacheStats
 from .models import (
     ActiveStream,
@@ -85,11 +87,9 @@ def create_media_embed(
 
 def create_stream_embed(stream: ActiveStream, thumb_url: str | None = None) -> Embed:
     """Create an embed for an active stream."""
-    year_str = f" ({stream.media_year})" if stream.media_year else ""
-
     embed = Embed(
         title=f"{stream.state_emoji} Now Playing",
-        description=f"**{stream.media_title}**{year_str}",
+        description=f"**{stream.media_title}**{format_year_suffix(stream.media_year)}",
         color=PLEX_COLOR,
     )
 
@@ -118,9 +118,8 @@ def create_stream_embed(stream: ActiveStream, thumb_url: str | None = None) -> E
 
     # Player info
     if stream.player_name:
-        player_info = stream.player_name
-        if stream.player_device:
-            player_info += f" ({stream.player_device})"
+        device = f" ({stream.player_device})" if stream.player_device else ""
+        player_info = f"{stream.player_name}{device}"
         embed.add_field(
             name="Player",
             value=player_info,
@@ -144,13 +143,12 @@ def create_streams_summary_embed(streams: list[ActiveStream]) -> Embed:
     embed.description = f"{len(streams)} active stream(s)"
 
     for stream in streams[:10]:  # Limit to 10 streams
-        year_str = f" ({stream.media_year})" if stream.media_year else ""
         value = (
             f"{stream.progress_bar} {stream.progress_percent:.0f}%\n"
             f"{stream.transcode_decision or 'Unknown'}"
         )
         embed.add_field(
-            name=f"{stream.state_emoji} {stream.media_title}{year_str}",
+            name=f"{stream.state_emoji} {stream.media_title}{format_year_suffix(stream.media_year)}",
             value=value,
             inline=True,
         )
@@ -163,9 +161,7 @@ def create_recently_added_embed(
     library: str | None = None,
 ) -> Embed:
     """Create an embed for recently added media."""
-    title = "📥 Recently Added"
-    if library:
-        title += f" to {library}"
+    title = f"📥 Recently Added to {library}" if library else "📥 Recently Added"
 
     embed = Embed(title=title, color=PLEX_COLOR)
 
@@ -173,24 +169,23 @@ def create_recently_added_embed(
         embed.description = "No recent additions found."
         return embed
 
+    # plexapi 4.18.1 makes datetime attributes timezone-aware when the optional
+    # timezone is enabled (naive by default). Working from the POSIX timestamp
+    # CachedMedia precomputes (added_ts) never mixes naive and aware datetimes,
+    # which would raise TypeError, and reads the clock once per embed.
+    now_ts = time.time()
     lines = []
     for item in media[:15]:
-        year_str = f" ({item.year})" if item.year else ""
         added = ""
         if item.added_at:
-            # plexapi 4.18.1 makes datetime attributes timezone-aware when the
-            # optional timezone is enabled (naive by default). Match the awareness
-            # of added_at so this subtraction never mixes naive and aware datetimes
-            # (which would raise TypeError). datetime.now(None) stays naive.
-            now = datetime.now(item.added_at.tzinfo)
-            days_ago = (now - item.added_at).days
+            days_ago = int(now_ts - item.added_ts) // 86400
             if days_ago == 0:
                 added = " • Today"
             elif days_ago == 1:
                 added = " • Yesterday"
             else:
                 added = f" • {days_ago}d ago"
-        lines.append(f"{item.type_emoji} **{item.title}**{year_str}{added}")
+        lines.append(f"{item.type_emoji} **{item.title}**{format_year_suffix(item.year)}{added}")
 
     embed.description = "\n".join(lines)
     return embed
@@ -198,11 +193,10 @@ def create_recently_added_embed(
 
 def create_request_embed(request: OverseerrRequest) -> Embed:
     """Create an embed for a media request."""
-    year_str = f" ({request.year})" if request.year else ""
     type_emoji = "🎬" if request.media_type == "movie" else "📺"
 
     embed = Embed(
-        title=f"{type_emoji} {request.title}{year_str}",
+        title=f"{type_emoji} {request.title}{format_year_suffix(request.year)}",
         color=OVERSEERR_COLOR,
     )
 
@@ -235,10 +229,8 @@ def create_request_embed(request: OverseerrRequest) -> Embed:
 
 def create_search_result_embed(result: OverseerrSearchResult) -> Embed:
     """Create an embed for an Overseerr search result."""
-    year_str = f" ({result.year})" if result.year else ""
-
     embed = Embed(
-        title=f"{result.type_emoji} {result.title}{year_str}",
+        title=f"{result.type_emoji} {result.title}{format_year_suffix(result.year)}",
         color=OVERSEERR_COLOR,
     )
 
@@ -289,9 +281,8 @@ def create_request_queue_embed(requests: list[OverseerrRequest]) -> Embed:
     lines = []
     for req in requests[:15]:
         type_emoji = "🎬" if req.media_type == "movie" else "📺"
-        year_str = f" ({req.year})" if req.year else ""
         lines.append(
-            f"{req.status_emoji} **{req.request_id}** | {type_emoji} {req.title}{year_str}\n"
+            f"{req.status_emoji} **{req.request_id}** | {type_emoji} {req.title}{format_year_suffix(req.year)}\n"
             f"   └─ By: {req.requested_by}"
         )
 
@@ -343,10 +334,12 @@ def create_server_stats_embed(
         )
 
         by_library = cache_stats["by_library"]
-        library_lines = [f"{lib}: {count}" for lib, count in sorted(by_library.items())]
+        # Only the first five sections (alphabetically) are shown, so select them
+        # without sorting and formatting every section
+        library_lines = [f"{lib}: {count}" for lib, count in heapq.nsmallest(5, by_library.items())]
         embed.add_field(
             name="By Section",
-            value="\n".join(library_lines[:5]) or "No data",  # Limit to 5
+            value="\n".join(library_lines) or "No data",
             inline=True,
         )
 
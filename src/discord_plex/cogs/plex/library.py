@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import logging
+import time
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
 
 from discord import ApplicationContext, Embed, Interaction
 
+from ...util import coalesce
 from .embeds import (
     PLEX_COLOR,
     create_error_embed,
@@ -20,6 +24,107 @@ from .views import MediaInfoView, MediaSelectView
 if TYPE_CHECKING:
     from .cog import PlexCog
 
+logger = logging.getLogger(__name__)
+
+# How long /plex recent and /plex stats serve a snapshot before refreshing it in the
+# background. Server stats include live stream counts, so they go stale sooner. For
+# another TTL after that the expired snapshot is still shown while it refreshes.
+_RECENT_SNAPSHOT_SECONDS = 300
+_STATS_SNAPSHOT_SECONDS = 60
+
+
+async def _get_snapshot(
+    cog: PlexCog,
+    key: Hashable,
+    fetch: Callable[[], Any],
+    ttl: float,
+) -> Any:
+    """Return the cached result of a blocking Plex call, fetching it on a cold start.
+
+    An expired snapshot is still returned immediately while a background task
+    replaces it, but only within ``ttl`` of expiring; anything older (say, after the
+    bot sat idle) is fetched inline like a cold start. Empty results (the Plex
+    client's error value) are never stored.
+    """
+    snapshot = cog._snapshots.get(key)
+    now = time.monotonic()
+    if snapshot is None or snapshot[1] + ttl <= now:
+        value = await asyncio.to_thread(fetch)
+        if value:
+            cog._snapshots[key] = (value, time.monotonic() + ttl)
+        return value
+
+    value, expires_at = snapshot
+    if expires_at <= now and key not in cog._snapshot_refreshes:
+
+        async def refresh() -> None:
+            try:
+                fresh = await asyncio.to_thread(fetch)
+                if fresh:
+                    cog._snapshots[key] = (fresh, time.monotonic() + ttl)
+            except Exception as e:
+                logger.error(f"Snapshot refresh failed for {key}: {e}")
+            finally:
+                cog._snapshot_refreshes.pop(key, None)
+
+        cog._snapshot_refreshes[key] = asyncio.create_task(refresh())
+    return value
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a speculative task, retrieving its exception if it already finished."""
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
+class _CacheRefreshError(Exception):
+    """Raised by :func:`_find_media` when the stale cache could not be refreshed."""
+
+
+async def _find_media(
+    cog: PlexCog,
+    query: str,
+    type_filter: MediaType | None,
+    library: str,
+) -> list[CachedMedia]:
+    """Search the cache, topping up thin results with a direct Plex search."""
+    # A cache refresh takes seconds, so start the direct Plex search alongside it in
+    # case the cache comes up short. A warm cache answers in milliseconds, so there
+    # it only runs when needed rather than loading Plex on every search.
+    direct_task: asyncio.Task[list[CachedMedia]] | None = None
+    try:
+        if cog.cache.is_stale:
+            direct_task = asyncio.create_task(
+                asyncio.to_thread(cog.plex_client.search, query, limit=10)
+            )
+            try:
+                await cog.cache.refresh()
+            except Exception as exc:
+                raise _CacheRefreshError(str(exc)) from exc
+
+        # Fuzzy ranking is CPU-bound, so keep it off the event loop
+        results = await asyncio.to_thread(
+            cog.cache.search, query, limit=20, media_type=type_filter, library=library
+        )
+
+        if len(results) < 5:
+            if direct_task is None:
+                direct_results = await asyncio.to_thread(cog.plex_client.search, query, limit=10)
+            else:
+                direct_results = await direct_task
+            # Cache hits keep their rank; setdefault skips direct hits already present
+            merged = {result.rating_key: result for result in results}
+            for item in direct_results:
+                merged.setdefault(item.rating_key, item)
+            results = list(merged.values())
+
+        return results
+    finally:
+        # Drop the speculative search unless it was awaited above, including when
+        # the command itself is cancelled mid-refresh
+        if direct_task is not None:
+            _discard_task(direct_task)
+
 
 async def plex_search(
     cog: PlexCog,
@@ -31,13 +136,6 @@ async def plex_search(
     """Search the Plex library with fuzzy matching."""
     await ctx.defer()
 
-    if cog.cache.is_stale:
-        try:
-            await cog.cache.refresh()
-        except Exception as exc:
-            await ctx.send_followup(embed=create_error_embed(f"Failed to refresh cache: {exc}"))
-            return
-
     type_filter = None
     if media_type:
         type_map = {
@@ -47,19 +145,19 @@ async def plex_search(
         }
         type_filter = type_map.get(media_type)
 
-    results = cog.cache.search(query, limit=20, media_type=type_filter, library=library)
-
-    if len(results) < 5:
-        loop = asyncio.get_running_loop()
-        direct_results = await loop.run_in_executor(
-            None,
-            lambda: cog.plex_client.search(query, limit=10),
+    # Identical searches running at the same time share one cache and Plex lookup
+    key = ("plex", query.lower().strip(), type_filter, library.lower())
+    try:
+        results = list(
+            await coalesce(
+                cog._search_inflight,
+                key,
+                lambda: _find_media(cog, query, type_filter, library),
+            )
         )
-        existing_keys = {result.rating_key for result in results}
-        for item in direct_results:
-            if item.rating_key not in existing_keys:
-                results.append(item)
-                existing_keys.add(item.rating_key)
+    except _CacheRefreshError as exc:
+        await ctx.send_followup(embed=create_error_embed(f"Failed to refresh cache: {exc}"))
+        return
 
     if not results:
         await ctx.send_followup(embed=create_error_embed(f'No results found for "{query}"'))
@@ -73,17 +171,24 @@ async def plex_search(
         title=f'🔍 Search results for "{query}"',
         color=PLEX_COLOR,
     )
-    lines = []
     display_results = results[:25]
-    for index, media in enumerate(display_results, start=1):
-        year_str = f" ({media.year})" if media.year else ""
-        lines.append(f"**{index}.** {media.type_emoji} {media.title}{year_str}")
-    embed.description = "\n".join(lines)
+    embed.description = "\n".join(
+        [
+            f"**{index}.** {media.type_emoji} {media.display_title}"
+            for index, media in enumerate(display_results, start=1)
+        ]
+    )
     embed.set_footer(text=f"Found {len(results)} results • Select one below for details")
 
     async def on_select(interaction: Interaction, media: CachedMedia) -> None:
+        # Acknowledge first: the poster lookup is bounded only by the Overseerr
+        # client's timeout, well beyond Discord's three-second response window
         await interaction.response.defer()
-        await show_media_info(cog, ctx, media)
+        # Show the details in the results message itself, keeping the picker so
+        # another result can be opened, instead of posting a new followup
+        embed, plex_web_url = await _build_media_info(cog, media)
+        view.set_plex_link(plex_web_url)
+        await interaction.edit_original_response(embed=embed, view=view)
 
     view = MediaSelectView(
         display_results,
@@ -93,12 +198,8 @@ async def plex_search(
     await ctx.send_followup(embed=embed, view=view)
 
 
-async def show_media_info(
-    cog: PlexCog,
-    ctx: ApplicationContext,
-    media: CachedMedia,
-) -> None:
-    """Display detailed media info."""
+async def _build_media_info(cog: PlexCog, media: CachedMedia) -> tuple[Embed, str]:
+    """Build the media info embed and the item's Plex Web URL."""
     thumb_url = None
     if media.tmdb_id:
         tmdb_type = "movie" if media.media_type == MediaType.MOVIE else "tv"
@@ -109,13 +210,17 @@ async def show_media_info(
         thumb_url = cog.plex_client.get_thumb_url(media.thumb)
         cog.logger.debug("Using Plex thumb URL: %s", thumb_url)
 
-    server_id = cog.plex_client.server.machineIdentifier
-    plex_web_url = (
-        f"https://app.plex.tv/desktop#!/server/{server_id}"
-        f"/details?key=%2Flibrary%2Fmetadata%2F{media.rating_key}"
-    )
+    plex_web_url = cog.plex_client.get_web_url(media.rating_key)
+    return create_media_embed(media, thumb_url), plex_web_url
+
 
-    embed = create_media_embed(media, thumb_url)
+async def show_media_info(
+    cog: PlexCog,
+    ctx: ApplicationContext,
+    media: CachedMedia,
+) -> None:
+    """Display detailed media info."""
+    embed, plex_web_url = await _build_media_info(cog, media)
     view = MediaInfoView(media, plex_web_url)
 
     await ctx.send_followup(embed=embed, view=view)
@@ -125,11 +230,7 @@ async def plex_playing(cog: PlexCog, ctx: ApplicationContext) -> None:
     """Show all active streams on the Plex server."""
     await ctx.defer()
 
-    loop = asyncio.get_running_loop()
-    streams = await loop.run_in_executor(
-        None,
-        cog.plex_client.get_active_streams,
-    )
+    streams = await asyncio.to_thread(cog.plex_client.get_active_streams)
 
     if not streams:
         await ctx.send_followup(
@@ -161,10 +262,11 @@ async def plex_recent(
     """Show recently added media."""
     await ctx.defer()
 
-    loop = asyncio.get_running_loop()
-    recent = await loop.run_in_executor(
-        None,
+    recent = await _get_snapshot(
+        cog,
+        ("recent", library.lower(), limit),
         lambda: cog.plex_client.get_recently_added(library, limit),
+        _RECENT_SNAPSHOT_SECONDS,
     )
 
     embed = create_recently_added_embed(recent, library)
@@ -175,10 +277,8 @@ async def plex_stats(cog: PlexCog, ctx: ApplicationContext) -> None:
     """Show Plex server and library statistics."""
     await ctx.defer()
 
-    loop = asyncio.get_running_loop()
-    server_info = await loop.run_in_executor(
-        None,
-        cog.plex_client.get_server_info,
+    server_info = await _get_snapshot(
+        cog, "server_info", cog.plex_client.get_server_info, _STATS_SNAPSHOT_SECONDS
     )
     cache_stats = cog.cache.get_stats()
 
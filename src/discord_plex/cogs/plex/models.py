@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from ...util import format_duration, format_year_suffix
+
 
 class MediaType(Enum):
     MOVIE = "movie"
@@ -22,7 +24,39 @@ class RequestStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+_MEDIA_TYPE_EMOJI = {
+    MediaType.MOVIE: "🎬",
+    MediaType.SHOW: "📺",
+    MediaType.EPISODE: "📺",
+    MediaType.SEASON: "📺",
+    MediaType.ARTIST: "🎤",
+    MediaType.ALBUM: "💿",
+    MediaType.TRACK: "🎵",
+}
+
+_STATE_EMOJI = {
+    "playing": "▶️",
+    "paused": "⏸️",
+    "buffering": "⏳",
+}
+
+# Ten-cell progress bars indexed by filled cells, 0-10
+_PROGRESS_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+_REQUEST_STATUS_EMOJI = {
+    RequestStatus.PENDING: "⏳",
+    RequestStatus.APPROVED: "✅",
+    RequestStatus.DECLINED: "❌",
+    RequestStatus.AVAILABLE: "🎉",
+    RequestStatus.PROCESSING: "⚙️",
+    RequestStatus.UNKNOWN: "❓",
+}
+
+# TMDB image CDN prefix for w500 posters; poster paths start with "/"
+TMDB_POSTER_BASE_URL = "https://image.tmdb.org/t/p/w500"
+
+
+@dataclass(slots=True)
 class CachedMedia:
     """Represents a cached media item from Plex."""
 
@@ -40,27 +74,22 @@ class CachedMedia:
     season_count: int | None = None  # For shows
     tmdb_id: int | None = None  # TMDB ID for poster lookup
     imdb_id: str | None = None  # IMDB ID (tt1234567 format)
+    # POSIX seconds derived from added_at at construction; -1 when unknown. Comparing
+    # timestamps also sidesteps mixing naive and tz-aware added_at values.
+    added_ts: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.added_ts = int(self.added_at.timestamp()) if self.added_at else -1
 
     @property
     def display_title(self) -> str:
         """Return title with year if available."""
-        if self.year:
-            return f"{self.title} ({self.year})"
-        return self.title
+        return f"{self.title}{format_year_suffix(self.year)}"
 
     @property
     def type_emoji(self) -> str:
         """Return emoji for media type."""
-        emoji_map = {
-            MediaType.MOVIE: "🎬",
-            MediaType.SHOW: "📺",
-            MediaType.EPISODE: "📺",
-            MediaType.SEASON: "📺",
-            MediaType.ARTIST: "🎤",
-            MediaType.ALBUM: "💿",
-            MediaType.TRACK: "🎵",
-        }
-        return emoji_map.get(self.media_type, "📁")
+        return _MEDIA_TYPE_EMOJI.get(self.media_type, "📁")
 
     @property
     def duration_formatted(self) -> str | None:
@@ -75,7 +104,7 @@ class CachedMedia:
         return f"{minutes}m"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveStream:
     """Represents an active stream on Plex."""
 
@@ -96,9 +125,7 @@ class ActiveStream:
     @property
     def progress_bar(self) -> str:
         """Return a visual progress bar."""
-        filled = int(self.progress_percent / 10)
-        empty = 10 - filled
-        return "█" * filled + "░" * empty
+        return _PROGRESS_BARS[min(10, max(0, int(self.progress_percent / 10)))]
 
     @property
     def progress_formatted(self) -> str:
@@ -110,26 +137,15 @@ class ActiveStream:
     @staticmethod
     def _format_time(ms: int) -> str:
         """Format milliseconds to HH:MM:SS or MM:SS."""
-        total_seconds = ms // 1000
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
+        return format_duration(ms)
 
     @property
     def state_emoji(self) -> str:
         """Return emoji for playback state."""
-        state_map = {
-            "playing": "▶️",
-            "paused": "⏸️",
-            "buffering": "⏳",
-        }
-        return state_map.get(self.state.lower(), "▶️")
+        return _STATE_EMOJI.get(self.state.lower(), "▶️")
 
 
-@dataclass
+@dataclass(slots=True)
 class PlexClient:
     """Represents a Plex client/player."""
 
@@ -141,7 +157,7 @@ class PlexClient:
     state: str | None = None  # idle, playing
 
 
-@dataclass
+@dataclass(slots=True)
 class OverseerrRequest:
     """Represents a media request from Overseerr."""
 
@@ -160,24 +176,16 @@ class OverseerrRequest:
     def poster_url(self) -> str | None:
         """Return full TMDB poster URL."""
         if self.poster_path:
-            return f"https://image.tmdb.org/t/p/w500{self.poster_path}"
+            return TMDB_POSTER_BASE_URL + self.poster_path
         return None
 
     @property
     def status_emoji(self) -> str:
         """Return emoji for request status."""
-        status_map = {
-            RequestStatus.PENDING: "⏳",
-            RequestStatus.APPROVED: "✅",
-            RequestStatus.DECLINED: "❌",
-            RequestStatus.AVAILABLE: "🎉",
-            RequestStatus.PROCESSING: "⚙️",
-            RequestStatus.UNKNOWN: "❓",
-        }
-        return status_map.get(self.status, "❓")
-
-
-@dataclass
+        return _REQUEST_STATUS_EMOJI.get(self.status, "❓")
+
+
+@dataclass(slots=True)
 class OverseerrSearchResult:
     """Represents a search result from Overseerr/TMDB."""
 
@@ -196,7 +204,7 @@ class OverseerrSearchResult:
     def poster_url(self) -> str | None:
         """Return full TMDB poster URL."""
         if self.poster_path:
-            return f"https://image.tmdb.org/t/p/w500{self.poster_path}"
+            return TMDB_POSTER_BASE_URL + self.poster_path
         return None
 
     @property
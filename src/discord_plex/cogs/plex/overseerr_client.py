@@ -1,10 +1,14 @@
+import asyncio
 import contextlib
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 
 import aiohttp
 
 from .models import (
+    TMDB_POSTER_BASE_URL,
     OverseerrRequest,
     OverseerrSearchResult,
     RequestStatus,
@@ -12,6 +16,23 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Poster paths almost never change, so remember them for an hour
+_POSTER_TTL_SECONDS = 3600
+_POSTER_CACHE_SIZE = 512
+
+# Page size and page cap for list endpoints fetched in full
+_PAGE_SIZE = 100
+_MAX_PAGES = 20
+
+# Overseerr request status codes
+_REQUEST_STATUS_BY_CODE = {
+    1: RequestStatus.PENDING,
+    2: RequestStatus.APPROVED,
+    3: RequestStatus.DECLINED,
+    4: RequestStatus.PROCESSING,
+    5: RequestStatus.AVAILABLE,
+}
+
 
 class OverseerrClient:
     """Async client for Overseerr API interactions."""
@@ -20,6 +41,8 @@ class OverseerrClient:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self._session: aiohttp.ClientSession | None = None
+        # (media_type, tmdb_id) -> (poster URL, time.monotonic() expiry), oldest first
+        self._poster_cache: OrderedDict[tuple[str, int], tuple[str | None, float]] = OrderedDict()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
@@ -28,7 +51,18 @@ class OverseerrClient:
                 headers={
                     "X-Api-Key": self.api_key,
                     "Content-Type": "application/json",
-                }
+                },
+                # Overseerr is a single host: keep a small pool of warm keep-alive
+                # connections and cache its DNS lookup
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                # Without a timeout a hung Overseerr would stall commands for aiohttp's
+                # default five minutes
+                timeout=aiohttp.ClientTimeout(total=15, connect=5),
             )
         return self._session
 
@@ -51,7 +85,9 @@ class OverseerrClient:
 
         try:
             async with session.request(method, url, json=json, params=params) as response:
-                if response.status == 200 or response.status == 201:
+                if response.status == 204:
+                    return {}  # Success with no body (e.g. DELETE)
+                if 200 <= response.status < 300:
                     return await response.json()
                 if response.status == 404:
                     logger.warning(f"Not found: {endpoint}")
@@ -63,6 +99,31 @@ class OverseerrClient:
             logger.error(f"Request error for {endpoint}: {e}")
             return None
 
+    async def _get_all_results(self, endpoint: str, params: dict | None = None) -> list[dict]:
+        """Fetch every page of a paginated list endpoint.
+
+        The first page reports the page count; the remaining pages are then fetched
+        concurrently. Pages that fail to load are skipped.
+        """
+        base_params = {**(params or {}), "take": _PAGE_SIZE}
+        first = await self._request("GET", endpoint, params={**base_params, "skip": 0})
+        if not first or "results" not in first:
+            return []
+
+        pages = min(first.get("pageInfo", {}).get("pages", 1), _MAX_PAGES)
+        rest = await asyncio.gather(
+            *(
+                self._request("GET", endpoint, params={**base_params, "skip": page * _PAGE_SIZE})
+                for page in range(1, pages)
+            )
+        )
+
+        results = list(first["results"])
+        for data in rest:
+            if data and "results" in data:
+                results.extend(data["results"])
+        return results
+
     async def search(self, query: str, page: int = 1) -> list[OverseerrSearchResult]:
         """Search for movies and TV shows."""
         results = []
@@ -104,6 +165,9 @@ class OverseerrClient:
                 with contextlib.suppress(ValueError, IndexError):
                     year = int(release_date[:4])
 
+            if item.get("posterPath") and item.get("id"):
+                self._remember_poster(media_type, item["id"], item["posterPath"])
+
             results.append(
                 OverseerrSearchResult(
                     media_type=media_type,
@@ -124,14 +188,7 @@ class OverseerrClient:
     @staticmethod
     def _convert_status(status: int) -> RequestStatus:
         """Convert Overseerr status code to RequestStatus."""
-        status_map = {
-            1: RequestStatus.PENDING,
-            2: RequestStatus.APPROVED,
-            3: RequestStatus.DECLINED,
-            4: RequestStatus.PROCESSING,
-            5: RequestStatus.AVAILABLE,
-        }
-        return status_map.get(status, RequestStatus.UNKNOWN)
+        return _REQUEST_STATUS_BY_CODE.get(status, RequestStatus.UNKNOWN)
 
     async def get_request(self, request_id: int) -> OverseerrRequest | None:
         """Get a specific request by ID."""
@@ -151,14 +208,18 @@ class OverseerrClient:
             params["filter"] = status
 
         # If user_id specified, we filter client-side as Overseerr
-        # doesn't have a direct user filter endpoint for all requests
-        data = await self._request("GET", "/request", params=params)
-
-        if not data or "results" not in data:
-            return []
+        # doesn't have a direct user filter endpoint for all requests,
+        # so every page is needed; otherwise the first page is enough
+        if user_id is not None:
+            results = await self._get_all_results("/request", params)
+        else:
+            data = await self._request("GET", "/request", params=params)
+            if not data or "results" not in data:
+                return []
+            results = data["results"]
 
         requests = []
-        for item in data["results"]:
+        for item in results:
             req = self._parse_request(item)
             if req and (user_id is None or (req.requested_by and str(user_id) in req.requested_by)):
                 requests.append(req)
@@ -172,39 +233,38 @@ class OverseerrClient:
     def _parse_request(self, data: dict) -> OverseerrRequest | None:
         """Parse request data into OverseerrRequest."""
         try:
-            media = data.get("media", {})
-            requested_by = data.get("requestedBy", {})
+            data_get = data.get
+            media = data_get("media", {})
+            media_get = media.get
+            requested_by = data_get("requestedBy", {})
 
-            media_type = media.get("mediaType", "movie")
-            tmdb_id = media.get("tmdbId", 0)
+            media_type = media_get("mediaType", "movie")
+            tmdb_id = media_get("tmdbId", 0)
 
-            # Get title from media info
-            title = "Unknown"
-            year = None
-            poster_path = None
+            # Get title and extra info from media info when available
+            title = media_get("title", "Unknown")
             overview = None
-
-            # Try to get extra info if available
-            if "title" in media:
-                title = media["title"]
-            if "releaseDate" in media:
+            year = None
+            release_date = media_get("releaseDate")
+            if release_date:
                 with contextlib.suppress(ValueError, IndexError, TypeError):
-                    year = int(media["releaseDate"][:4])
-            if "posterPath" in media:
-                poster_path = media["posterPath"]
+                    year = int(release_date[:4])
+            poster_path = media_get("posterPath")
+            if poster_path and tmdb_id:
+                self._remember_poster(media_type, tmdb_id, poster_path)
 
             # Parse status
-            status = self._convert_status(data.get("status", 1))
+            status = self._convert_status(data_get("status", 1))
 
-            # Parse date
-            created_at = data.get("createdAt")
+            # Parse date; fromisoformat accepts the trailing "Z" since Python 3.11
+            created_at = data_get("createdAt")
             requested_at = datetime.now()
             if created_at:
                 with contextlib.suppress(ValueError):
-                    requested_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                    requested_at = datetime.fromisoformat(created_at)
 
             return OverseerrRequest(
-                request_id=data.get("id", 0),
+                request_id=data_get("id", 0),
                 media_type=media_type,
                 tmdb_id=tmdb_id,
                 title=title,
@@ -284,15 +344,7 @@ class OverseerrClient:
 
     async def delete_request(self, request_id: int) -> bool:
         """Delete a request."""
-        session = await self._get_session()
-        url = f"{self.base_url}/api/v1/request/{request_id}"
-
-        try:
-            async with session.delete(url) as response:
-                return response.status == 204
-        except Exception as e:
-            logger.error(f"Error deleting request: {e}")
-            return False
+        return await self._request("DELETE", f"/request/{request_id}") is not None
 
     async def get_media_details(
         self,
@@ -324,17 +376,38 @@ class OverseerrClient:
         tmdb_id: int,
     ) -> str | None:
         """Get TMDB poster URL for a media item."""
+        key = (media_type, tmdb_id)
+        cached = self._poster_cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            self._poster_cache.move_to_end(key)
+            return cached[0]
+
         details = await self.get_media_details(media_type, tmdb_id)
-        if details and details.get("posterPath"):
-            return f"https://image.tmdb.org/t/p/w500{details['posterPath']}"
-        return None
+        if details is None:
+            # Failed lookups aren't cached so the next call retries
+            return None
+
+        return self._remember_poster(media_type, tmdb_id, details.get("posterPath"))
+
+    def _remember_poster(
+        self, media_type: str, tmdb_id: int, poster_path: str | None
+    ) -> str | None:
+        """Cache the TMDB poster URL for an item and return it.
+
+        Called by get_poster_url and by any response that already carries a posterPath,
+        so later poster lookups for those items skip the details request.
+        """
+        poster_url = TMDB_POSTER_BASE_URL + poster_path if poster_path else None
+        key = (media_type, tmdb_id)
+        self._poster_cache[key] = (poster_url, time.monotonic() + _POSTER_TTL_SECONDS)
+        self._poster_cache.move_to_end(key)
+        if len(self._poster_cache) > _POSTER_CACHE_SIZE:
+            self._poster_cache.popitem(last=False)
+        return poster_url
 
     async def get_users(self) -> list[dict]:
         """Get list of Overseerr users."""
-        data = await self._request("GET", "/user", params={"take": 100})
-        if not data or "results" not in data:
-            return []
-        return data["results"]
+        return await self._get_all_results("/user")
 
     async def get_user_by_plex_id(self, plex_id: int) -> dict | None:
         """Find an Overseerr user by their Plex ID."""
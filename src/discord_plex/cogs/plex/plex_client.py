@@ -1,8 +1,13 @@
 import contextlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
 from plexapi.exceptions import NotFound
+from plexapi.library import LibrarySection
 from plexapi.server import PlexServer
+from requests.adapters import HTTPAdapter
 
 from .models import (
     ActiveStream,
@@ -13,6 +18,30 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Plex calls run on worker threads (asyncio.to_thread), so keep enough pooled
+# keep-alive connections for concurrent commands to avoid fresh handshakes
+_HTTP_POOL_SIZE = 16
+# Library sections scanned concurrently during a full cache refresh
+_SECTION_SCAN_WORKERS = 4
+# How long the library section list is reused before asking the server again
+_SECTIONS_TTL_SECONDS = 60.0
+# Playback sessions are shared between /plex streams and /plex stats for this long
+_SESSIONS_TTL_SECONDS = 2.0
+
+# Display labels for the videoResolution values Plex reports
+_RESOLUTION_LABELS = {
+    "4k": "4K",
+    "2160": "4K",
+    "1080": "1080p",
+    "720": "720p",
+    "576": "576p",
+    "480": "480p",
+    "sd": "SD",
+}
+
+# MediaType values are the Plex type strings
+_MEDIA_TYPE_BY_PLEX_TYPE = {media_type.value: media_type for media_type in MediaType}
+
 
 class PlexClientWrapper:
     """Wrapper for Plex Media Server API interactions."""
@@ -20,39 +49,98 @@ class PlexClientWrapper:
     def __init__(self, base_url: str, token: str):
         self.base_url = base_url.rstrip("/")
         self.token = token
+        self._token_query = f"?X-Plex-Token={token}"  # appended to thumb URLs
         self._server: PlexServer | None = None
+        self._web_url_prefix: str | None = None  # Plex Web item URL up to the rating key
+        self._session = self._create_session()
+        # (fetched at monotonic time, sections, first section per lowercased title)
+        self._sections: tuple[float, list[LibrarySection], dict[str, LibrarySection]] | None = None
+        self._sessions: tuple[float, list] | None = None  # (fetched at monotonic time, sessions)
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the pooled HTTP session shared by every PlexServer connection."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_HTTP_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     @property
     def server(self) -> PlexServer:
         """Lazy-load the Plex server connection."""
         if self._server is None:
-            self._server = PlexServer(self.base_url, self.token)
+            self._server = PlexServer(self.base_url, self.token, session=self._session)
         return self._server
 
     def reconnect(self) -> None:
-        """Force reconnection to server."""
+        """Force reconnection to server, keeping the pooled HTTP session."""
+        self._server = None
+        self._web_url_prefix = None
+        self._sections = None
+        self._sessions = None
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
         self._server = None
+        self._sections = None
+        self._sessions = None
+        self._session.close()
+
+    def _get_sections(
+        self, refresh: bool = False
+    ) -> tuple[list[LibrarySection], dict[str, LibrarySection]]:
+        """Return library sections and a lowercased-title index, reused for a short TTL."""
+        now = time.monotonic()
+        if refresh or self._sections is None or now - self._sections[0] >= _SECTIONS_TTL_SECONDS:
+            sections = self.server.library.sections()
+            by_title: dict[str, LibrarySection] = {}
+            for section in sections:
+                by_title.setdefault(section.title.lower(), section)
+            self._sections = (now, sections, by_title)
+        return self._sections[1], self._sections[2]
+
+    def _get_sessions(self) -> list:
+        """Return active playback sessions, reusing a response from the last few seconds."""
+        now = time.monotonic()
+        if self._sessions is None or now - self._sessions[0] >= _SESSIONS_TTL_SECONDS:
+            self._sessions = (now, self.server.sessions())
+        return self._sessions[1]
 
     def get_thumb_url(self, thumb_path: str | None) -> str | None:
         """Convert Plex thumb path to full URL with token."""
         if not thumb_path:
             return None
-        return f"{self.base_url}{thumb_path}?X-Plex-Token={self.token}"
+        return f"{self.base_url}{thumb_path}{self._token_query}"
+
+    def get_web_url(self, rating_key: str) -> str:
+        """Get the Plex Web URL for an item, reusing the server's machine identifier."""
+        if self._web_url_prefix is None:
+            self._web_url_prefix = (
+                f"https://app.plex.tv/desktop#!/server/{self.server.machineIdentifier}"
+                "/details?key=%2Flibrary%2Fmetadata%2F"
+            )
+        return self._web_url_prefix + rating_key
 
     def get_all_media(self) -> list[CachedMedia]:
         """Fetch all media from all libraries for caching."""
         media_items = []
 
         try:
-            for section in self.server.library.sections():
-                section_type = section.type
-                logger.info(f"Scanning library: {section.title} ({section_type})")
-
-                if section_type in ("movie", "show", "artist"):
-                    for item in section.all():
-                        cached = self._convert_to_cached_media(item, section.title)
-                        if cached:
-                            media_items.append(cached)
+            # A full refresh re-reads the section list so new libraries are picked up
+            sections = [
+                section
+                for section in self._get_sections(refresh=True)[0]
+                if section.type in ("movie", "show", "artist")
+            ]
+            # Each section listing is an independent request, so scan them on a few
+            # threads; map keeps section order and re-raises the first failure
+            if sections:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(sections), _SECTION_SCAN_WORKERS)
+                ) as executor:
+                    for section_items in executor.map(self._scan_section, sections):
+                        media_items.extend(section_items)
 
         except Exception as e:
             logger.error(f"Error fetching media library: {e}")
@@ -61,6 +149,21 @@ class PlexClientWrapper:
         logger.info(f"Cached {len(media_items)} media items")
         return media_items
 
+    def _scan_section(self, section) -> list[CachedMedia]:
+        """Convert every item of a library section to CachedMedia."""
+        logger.info(f"Scanning library: {section.title} ({section.type})")
+        media_items = []
+        for item in section.all():
+            # The listing already carries every field we cache (guids included).
+            # Without this, reading an attribute that is unset for the item (no
+            # year, rating or guids, common for artists) makes plexapi reload the
+            # item, one request per item.
+            item._autoReload = False
+            cached = self._convert_to_cached_media(item, section.title)
+            if cached:
+                media_items.append(cached)
+        return media_items
+
     def _convert_to_cached_media(self, item, library_name: str) -> CachedMedia | None:
         """Convert a Plex media item to CachedMedia."""
         try:
@@ -71,25 +174,27 @@ class PlexClientWrapper:
             # Extract external IDs (TMDB, IMDB) from guids
             tmdb_id, imdb_id = self._extract_external_ids(item)
 
+            # Every cached Plex type defines thumb, summary, rating and addedAt;
+            # artists and albums have no year or duration attribute at all
             cached = CachedMedia(
                 rating_key=str(item.ratingKey),
                 title=item.title,
                 year=getattr(item, "year", None),
                 media_type=media_type,
                 library=library_name,
-                thumb=item.thumb if hasattr(item, "thumb") else None,
-                summary=getattr(item, "summary", None),
-                rating=getattr(item, "rating", None),
+                thumb=item.thumb,
+                summary=item.summary,
+                rating=item.rating,
                 duration=getattr(item, "duration", None),
-                added_at=getattr(item, "addedAt", None),
+                added_at=item.addedAt,
                 tmdb_id=tmdb_id,
                 imdb_id=imdb_id,
             )
 
             # Add show-specific info
             if media_type == MediaType.SHOW:
-                cached.episode_count = getattr(item, "leafCount", None)
-                cached.season_count = getattr(item, "childCount", None)
+                cached.episode_count = item.leafCount
+                cached.season_count = item.childCount
 
             return cached
 
@@ -124,16 +229,7 @@ class PlexClientWrapper:
     @staticmethod
     def _get_media_type(plex_type: str) -> MediaType | None:
         """Convert Plex type string to MediaType enum."""
-        type_map = {
-            "movie": MediaType.MOVIE,
-            "show": MediaType.SHOW,
-            "episode": MediaType.EPISODE,
-            "season": MediaType.SEASON,
-            "artist": MediaType.ARTIST,
-            "album": MediaType.ALBUM,
-            "track": MediaType.TRACK,
-        }
-        return type_map.get(plex_type)
+        return _MEDIA_TYPE_BY_PLEX_TYPE.get(plex_type)
 
     def search(self, query: str, limit: int = 10) -> list[CachedMedia]:
         """Search Plex library directly."""
@@ -174,7 +270,7 @@ class PlexClientWrapper:
         """Get all currently active streams."""
         streams = []
         try:
-            sessions = self.server.sessions()
+            sessions = self._get_sessions()
             logger.debug(f"Fetching active streams: found {len(sessions)} sessions")
             for session in sessions:
                 stream = self._convert_to_active_stream(session)
@@ -195,22 +291,22 @@ class PlexClientWrapper:
 
             # Get transcode info
             transcode_session = session.transcodeSessions[0] if session.transcodeSessions else None
-            transcode_decision = None
-            quality = None
-
-            if transcode_session:
-                transcode_decision = "Transcode"
-                quality = f"{transcode_session.videoDecision}"
+            transcode_decision = "Transcode" if transcode_session else "Direct Play"
+
+            # Quality comes from the media resolution, falling back to the transcode's
+            # video decision when the resolution is unknown
+            media = session.media[0] if session.media else None
+            resolution = getattr(media, "videoResolution", None) if media else None
+            if resolution:
+                resolution = str(resolution)
+                quality = _RESOLUTION_LABELS.get(resolution.lower())
+                if quality is None:
+                    # Avoid "1080pp" - only add "p" to bare line counts
+                    quality = resolution + "p" if resolution.isdigit() else resolution
+            elif transcode_session:
+                quality = str(transcode_session.videoDecision)
             else:
-                transcode_decision = "Direct Play"
-
-            # Get quality from media
-            if session.media and session.media[0]:
-                media = session.media[0]
-                if hasattr(media, "videoResolution"):
-                    resolution = str(media.videoResolution)
-                    # Avoid "1080pp" - only add "p" if not already present
-                    quality = resolution if resolution.endswith("p") else f"{resolution}p"
+                quality = None
 
             # Calculate progress
             view_offset = getattr(session, "viewOffset", 0) or 0
@@ -263,18 +359,24 @@ class PlexClientWrapper:
         try:
             if library:
                 # Search specific library - section.recentlyAdded accepts maxresults
-                for section in self.server.library.sections():
-                    if section.title.lower() == library.lower():
-                        for item in section.recentlyAdded(maxresults=limit):
-                            cached = self._convert_to_cached_media(item, section.title)
-                            if cached:
-                                results.append(cached)
-                        break
+                section = self._get_sections()[1].get(library.lower())
+                if section is not None:
+                    for item in section.recentlyAdded(maxresults=limit):
+                        cached = self._convert_to_cached_media(item, section.title)
+                        if cached:
+                            results.append(cached)
             else:
-                # Search all libraries - Library.recentlyAdded doesn't accept maxresults
-                # so we slice the results manually
-                all_recent = self.server.library.recentlyAdded()
-                for item in all_recent[:limit]:
+                # Search all libraries - Library.recentlyAdded() doesn't accept
+                # maxresults and would page through every recent item, so query the
+                # same server-wide endpoint directly and stop after ``limit`` items.
+                # includeGuids matches what Library.recentlyAdded() requests; without
+                # it every item's guids are empty and reading them reloads the item.
+                all_recent = self.server.library.fetchItems(
+                    "/library/recentlyAdded", maxresults=limit, params={"includeGuids": 1}
+                )
+                for item in all_recent:
+                    # As in _scan_section, the listing carries every cached field
+                    item._autoReload = False  # type: ignore[union-attr]
                     library_name = self._get_library_for_item(item)
                     cached = self._convert_to_cached_media(item, library_name)
                     if cached:
@@ -287,7 +389,7 @@ class PlexClientWrapper:
     def get_libraries(self) -> list[str]:
         """Get list of library names."""
         try:
-            return [section.title for section in self.server.library.sections()]
+            return [section.title for section in self._get_sections()[0]]
         except Exception as e:
             logger.error(f"Error fetching libraries: {e}")
             return []
@@ -326,10 +428,13 @@ class PlexClientWrapper:
         """Get server information."""
         logger.debug("Fetching server info...")
         try:
-            transcode_sessions = self.server.transcodeSessions()
-            sessions = self.server.sessions()
-            transcode_count = len(list(transcode_sessions)) if transcode_sessions else 0
-            stream_count = len(list(sessions)) if sessions else 0
+            # Each playback session embeds its TranscodeSession, so one /status/sessions
+            # request yields both counts
+            sessions = self._get_sessions()
+            stream_count = len(sessions)
+            transcode_count = sum(
+                1 for session in sessions if getattr(session, "transcodeSessions", None)
+            )
             info = {
                 "name": self.server.friendlyName,
                 "version": self.server.version,
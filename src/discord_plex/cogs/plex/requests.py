@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from discord import ApplicationContext, Embed, Interaction
 
+from ...util import coalesce, format_year_suffix
 from .embeds import OVERSEERR_COLOR, create_error_embed, create_request_queue_embed
 from .models import OverseerrSearchResult
 from .views import RequestSelectView
@@ -12,6 +13,15 @@ if TYPE_CHECKING:
     from .cog import PlexCog
 
 
+def _status_suffix(result: OverseerrSearchResult) -> str:
+    """Return the availability marker shown after a search result."""
+    if result.already_available:
+        return " ✅"
+    if result.already_requested:
+        return " 📋"
+    return ""
+
+
 async def request_search(
     cog: PlexCog,
     ctx: ApplicationContext,
@@ -27,7 +37,14 @@ async def request_search(
         query,
         media_type or "any",
     )
-    results = await cog.overseerr_client.search(query)
+    # Identical searches running at the same time share one Overseerr request
+    results = list(
+        await coalesce(
+            cog._search_inflight,
+            ("overseerr", query.lower().strip()),
+            lambda: cog.overseerr_client.search(query),
+        )
+    )
 
     if media_type:
         results = [result for result in results if result.media_type == media_type]
@@ -50,17 +67,13 @@ async def request_search(
         title=f'🔍 Search results for "{query}"',
         color=OVERSEERR_COLOR,
     )
-    lines = []
-    for index, result in enumerate(results[:10], start=1):
-        year_str = f" ({result.year})" if result.year else ""
-        status = ""
-        if result.already_available:
-            status = " ✅"
-        elif result.already_requested:
-            status = " 📋"
-        lines.append(f"**{index}.** {result.type_emoji} {result.title}{year_str}{status}")
-
-    embed.description = "\n".join(lines)
+    embed.description = "\n".join(
+        [
+            f"**{index}.** {result.type_emoji} {result.title}"
+            f"{format_year_suffix(result.year)}{_status_suffix(result)}"
+            for index, result in enumerate(results[:10], start=1)
+        ]
+    )
     embed.set_footer(text="✅ = Available | 📋 = Requested")
 
     await ctx.send_followup(embed=embed, view=view)
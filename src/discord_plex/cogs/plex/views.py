@@ -4,9 +4,20 @@ from typing import Any
 from discord import ButtonStyle, Interaction, SelectOption
 from discord.ui import Button, Select, View, button
 
+from ...util import format_year_suffix
 from .models import CachedMedia, OverseerrSearchResult
 
 
+def _plex_link_button(plex_web_url: str) -> Button:
+    """Build the link button that opens an item in Plex Web."""
+    return Button(
+        label="Open in Plex",
+        style=ButtonStyle.link,
+        url=plex_web_url,
+        emoji="▶️",
+    )
+
+
 class MediaSelectView(View):
     """View with a select menu for choosing media."""
 
@@ -21,11 +32,12 @@ class MediaSelectView(View):
         self.media_items = media_items[:25]  # Discord limit
         self.callback = callback
 
-        # Build options
+        # Build options, indexing items by option value (first wins, like the menu)
         options = []
+        self._items_by_key: dict[str, CachedMedia] = {}
         for item in self.media_items:
-            year_str = f" ({item.year})" if item.year else ""
-            label = f"{item.title}{year_str}"[:100]  # Max label length
+            self._items_by_key.setdefault(item.rating_key, item)
+            label = item.display_title[:100]  # Max label length
             description = item.library[:100] if item.library else None
             options.append(
                 SelectOption(
@@ -44,17 +56,23 @@ class MediaSelectView(View):
         )
         self.select.callback = self._handle_select
         self.add_item(self.select)
+        self._link_button: Button | None = None
+
+    def set_plex_link(self, plex_web_url: str | None) -> None:
+        """Show an Open in Plex button for the selected item, replacing any previous one."""
+        if self._link_button is not None:
+            self.remove_item(self._link_button)
+            self._link_button = None
+        if plex_web_url:
+            self._link_button = _plex_link_button(plex_web_url)
+            self.add_item(self._link_button)
 
     async def _handle_select(self, interaction: Interaction) -> None:
         """Handle selection."""
         values = self.select.values or []
         if not values:
             return
-        selected_key = values[0]
-        selected_item = next(
-            (m for m in self.media_items if m.rating_key == selected_key),
-            None,
-        )
+        selected_item = self._items_by_key.get(values[0])
         if selected_item:
             await self.callback(interaction, selected_item)
 
@@ -73,10 +91,12 @@ class RequestSelectView(View):
         self.results = results[:25]
         self.callback = callback
 
+        # Index results by option value (first wins, like the menu)
         options = []
+        self._results_by_value: dict[str, OverseerrSearchResult] = {}
         for result in self.results:
-            year_str = f" ({result.year})" if result.year else ""
-            label = f"{result.title}{year_str}"[:100]
+            self._results_by_value.setdefault(str(result.tmdb_id), result)
+            label = f"{result.title}{format_year_suffix(result.year)}"[:100]
 
             # Status description
             if result.already_available:
@@ -109,12 +129,7 @@ class RequestSelectView(View):
         values = self.select.values or []
         if not values:
             return
-        selected_value: str = values[0]
-        selected_id = int(selected_value)
-        selected_result = next(
-            (r for r in self.results if r.tmdb_id == selected_id),
-            None,
-        )
+        selected_result = self._results_by_value.get(values[0])
         if selected_result:
             await self.callback(interaction, selected_result)
 
@@ -170,14 +185,7 @@ class MediaInfoView(View):
         super().__init__(timeout=timeout)
 
         if plex_web_url:
-            self.add_item(
-                Button(
-                    label="Open in Plex",
-                    style=ButtonStyle.link,
-                    url=plex_web_url,
-                    emoji="▶️",
-                )
-            )
+            self.add_item(_plex_link_button(plex_web_url))
 
 
 class SeasonSelectView(View):
@@ -1,5 +1,13 @@
 """Utility functions for the Discord Plex bot."""
 
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 def chunk_text(text: str, chunk_size: int = 4096) -> list[str]:
     """
@@ -7,26 +15,35 @@ def chunk_text(text: str, chunk_size: int = 4096) -> list[str]:
 
     Used for splitting long messages to fit Discord's embed limits.
     """
-    if len(text) <= chunk_size:
+    length = len(text)
+    if length <= chunk_size:
         return [text]
 
+    # Walk a cursor over the original string so each chunk costs one slice,
+    # rather than re-slicing and stripping the remaining text every round
     chunks = []
-    while text:
-        if len(text) <= chunk_size:
-            chunks.append(text)
+    half = chunk_size // 2
+    start = 0
+    while start < length:
+        if length - start <= chunk_size:
+            chunks.append(text[start:])
             break
 
+        end = start + chunk_size
         # Try to split at newline
-        split_idx = text.rfind("\n", 0, chunk_size)
-        if split_idx == -1 or split_idx < chunk_size // 2:
+        split_idx = text.rfind("\n", start, end)
+        if split_idx == -1 or split_idx - start < half:
             # No good newline, try space
-            split_idx = text.rfind(" ", 0, chunk_size)
-        if split_idx == -1 or split_idx < chunk_size // 2:
+            split_idx = text.rfind(" ", start, end)
+        if split_idx == -1 or split_idx - start < half:
             # No good split point, force split
-            split_idx = chunk_size
+            split_idx = end
 
-        chunks.append(text[:split_idx])
-        text = text[split_idx:].lstrip()
+        chunks.append(text[start:split_idx])
+        # Skip the whitespace the next chunk would otherwise start with
+        start = split_idx
+        while start < length and text[start].isspace():
+            start += 1
 
     return chunks
 
@@ -40,21 +57,50 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
 
 def format_duration(milliseconds: int) -> str:
     """Format duration in milliseconds to human-readable string."""
-    total_seconds = milliseconds // 1000
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    minutes, seconds = divmod(milliseconds // 1000, 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
         return f"{hours}:{minutes:02d}:{seconds:02d}"
     return f"{minutes}:{seconds:02d}"
 
 
+def format_year_suffix(year: int | None) -> str:
+    """Return " (year)" for titles, or an empty string when the year is unknown."""
+    return f" ({year})" if year else ""
+
+
 def format_size(bytes_size: int) -> str:
     """Format file size in bytes to human-readable string."""
-    size: float = float(bytes_size)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    if bytes_size < 1024:
+        return f"{bytes_size:.1f} B"
+    # Each unit is 2**10 of the previous, so the bit length picks it directly
+    unit_idx = min((bytes_size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (unit_idx * 10)):.1f} {_SIZE_UNITS[unit_idx]}"
+
+
+async def coalesce(
+    inflight: dict[Hashable, asyncio.Task[Any]],
+    key: Hashable,
+    factory: Callable[[], Coroutine[Any, Any, T]],
+) -> T:
+    """
+    Await the in-flight task for ``key``, starting ``factory()`` if there is none.
+
+    Concurrent callers with the same key share one task and its result (or exception).
+    The task is shielded, so a cancelled caller does not cancel it for the others.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(factory())
+        inflight[key] = task
+
+        def _on_done(done: asyncio.Task[Any]) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+            # Mark any failure retrieved in case every caller was cancelled first
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_on_done)
+    return await asyncio.shield(task)
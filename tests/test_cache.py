@@ -1,9 +1,13 @@
 import asyncio
+import threading
+import time
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from discord_plex.cogs.plex import cache as cache_module
 from discord_plex.cogs.plex.cache import LibraryCache
 from discord_plex.cogs.plex.models import CachedMedia, MediaType
 
@@ -44,21 +48,23 @@ class TestLibraryCache:
             ),
         ]
 
+    def _swap_in(self, cache):
+        self.cache._snapshot = cache_module._CacheSnapshot(cache)
+
     def _populate_cache(self):
-        for item in self.test_media:
-            self.cache._cache[item.rating_key] = item
-            self.cache._index_title(item)
+        self._swap_in({item.rating_key: item for item in self.test_media})
         self.cache._last_refresh = datetime.now()
+        self.cache._last_refresh_mono = time.monotonic()
 
     def test_is_stale_when_never_refreshed(self):
         assert self.cache.is_stale is True
 
     def test_is_stale_when_recently_refreshed(self):
-        self.cache._last_refresh = datetime.now()
+        self.cache._last_refresh_mono = time.monotonic()
         assert self.cache.is_stale is False
 
     def test_is_stale_when_old(self):
-        self.cache._last_refresh = datetime.now() - timedelta(minutes=60)
+        self.cache._last_refresh_mono = time.monotonic() - 60 * 60
         assert self.cache.is_stale is True
 
     def test_get_by_key(self):
@@ -84,23 +90,161 @@ class TestLibraryCache:
         assert len(results) > 0
         assert results[0].title == "Breaking Bad"
 
+    def test_search_ignores_word_order_and_spacing(self):
+        self._populate_cache()
+        results = self.cache.search("  bad   BREAKING ")
+        assert results[0].title == "Breaking Bad"
+
+    def test_search_trigram_shortlist_keeps_typos_and_subset_matches(self):
+        self._populate_cache()
+
+        assert self.cache.search("intersteller")[0].title == "Interstellar"
+        assert self.cache.search("interstellar christopher nolan")[0].title == "Interstellar"
+        assert self.cache._snapshot.trigram_candidates("zzzz qqqq") == []
+
+    def test_trigram_shortlist_keeps_best_overlap_when_capped(self, monkeypatch):
+        monkeypatch.setattr("discord_plex.cogs.plex.cache._TRIGRAM_MAX_CANDIDATES", 1)
+        self._populate_cache()
+
+        candidates = self.cache._snapshot.trigram_candidates("breaking bad")
+
+        assert candidates is not None
+        titles_list = self.cache._snapshot.titles_list
+        assert [titles_list[position] for position in candidates] == ["bad breaking"]
+        assert self.cache.search("breaking bad")[0].rating_key == "1"
+
     def test_search_with_type_filter(self):
         self._populate_cache()
         results = self.cache.search("matrix", media_type=MediaType.MOVIE)
         assert len(results) == 1
         assert results[0].title == "The Matrix"
 
+    def test_search_filter_fills_limit_past_filtered_out_matches(self):
+        self.test_media += [
+            CachedMedia(
+                rating_key="5",
+                title="The Matrix Reloaded",
+                year=2003,
+                media_type=MediaType.MOVIE,
+                library="Movies",
+            ),
+            CachedMedia(
+                rating_key="6",
+                title="The Matrix",
+                year=2021,
+                media_type=MediaType.SHOW,
+                library="TV Shows",
+            ),
+        ]
+        self._populate_cache()
+
+        results = self.cache.search("the matrix", limit=2, library="Movies")
+
+        assert [m.rating_key for m in results] == ["3", "5"]
+
     def test_search_with_library_filter(self):
         self._populate_cache()
         results = self.cache.search("breaking", library="TV Shows")
         assert len(results) > 0
         assert results[0].media_type == MediaType.SHOW
 
+    def test_search_trailing_year_ranks_matching_year_first(self):
+        self.test_media += [
+            CachedMedia(
+                rating_key="5",
+                title="Dune",
+                year=1984,
+                media_type=MediaType.MOVIE,
+                library="Movies",
+            ),
+            CachedMedia(
+                rating_key="6",
+                title="Dune",
+                year=2021,
+                media_type=MediaType.MOVIE,
+                library="Movies",
+            ),
+            CachedMedia(
+                rating_key="7",
+                title="Blade Runner 2049",
+                year=2017,
+                media_type=MediaType.MOVIE,
+                library="Movies",
+            ),
+        ]
+        self._populate_cache()
+
+        assert [m.rating_key for m in self.cache.search("dune 2021")] == ["6", "5"]
+        assert [m.rating_key for m in self.cache.search("Dune (1984)", limit=1)] == ["5"]
+        assert self.cache.search("blade runner 2049")[0].rating_key == "7"
+
+    def test_repeated_search_returns_independent_lists(self):
+        self._populate_cache()
+        first = self.cache.search("breaking bad")
+        first.append(self.test_media[3])
+
+        second = self.cache.search("Breaking Bad")
+
+        assert [m.rating_key for m in second] == ["1"]
+        assert self.cache._snapshot.search.cache_info().hits == 1
+
+    def test_search_respects_limit_and_keeps_best_match_first(self):
+        self._populate_cache()
+        results = self.cache.search("better call saul", limit=1)
+        assert [m.rating_key for m in results] == ["2"]
+
     def test_search_no_results(self):
         self._populate_cache()
         results = self.cache.search("xyznonexistent")
         assert len(results) == 0
 
+    def test_search_sees_titles_added_by_rebuild(self):
+        self._populate_cache()
+        assert self.cache.search("Dune") == []
+
+        dune = CachedMedia(
+            rating_key="5",
+            title="Dune",
+            year=2021,
+            media_type=MediaType.MOVIE,
+            library="Movies",
+        )
+        self._swap_in({**self.cache._snapshot.cache, dune.rating_key: dune})
+
+        results = self.cache.search("Dune")
+        assert [m.rating_key for m in results] == ["5"]
+
+    def test_search_overlapping_rebuild_does_not_poison_new_snapshot(self):
+        self._populate_cache()
+        old_snapshot = self.cache._snapshot
+        dune = CachedMedia(
+            rating_key="5",
+            title="Dune",
+            year=2021,
+            media_type=MediaType.MOVIE,
+            library="Movies",
+        )
+        self._swap_in({dune.rating_key: dune})
+
+        # A search that read the old snapshot before the swap finishes afterwards,
+        # against indexes that are still self-consistent
+        assert old_snapshot.search("interstellar", 10, None, None)[0].rating_key == "4"
+        assert old_snapshot.search("dune", 10, None, None) == ()
+
+        assert [m.rating_key for m in self.cache.search("dune")] == ["5"]
+        assert self.cache.search("interstellar") == []
+
+    def test_get_all_uses_library_and_type_filters(self):
+        self._populate_cache()
+
+        assert {m.rating_key for m in self.cache.get_all(library="tv shows")} == {"1", "2"}
+        assert {m.rating_key for m in self.cache.get_all(media_type=MediaType.MOVIE)} == {
+            "3",
+            "4",
+        }
+        assert self.cache.get_all(media_type=MediaType.MOVIE, library="TV Shows") == []
+        assert len(self.cache.get_all()) == 4
+
     def test_get_libraries(self):
         self._populate_cache()
         libraries = self.cache.get_libraries()
@@ -158,14 +302,85 @@ class TestLibraryCache:
             library="Movies",
             added_at=None,
         )
-        for item in (aware, naive, missing):
-            self.cache._cache[item.rating_key] = item
+        self._swap_in({item.rating_key: item for item in (aware, naive, missing)})
 
         result = self.cache.get_recently_added(limit=10)
 
         # Newest first; item with no added_at sorts last.
         assert [m.rating_key for m in result] == ["aware", "naive", "missing"]
 
+    def test_recently_added_filters_by_library_and_limit(self):
+        now = datetime.now()
+        self.test_media = [
+            replace(item, added_at=now - timedelta(days=offset))
+            for offset, item in enumerate(self.test_media)
+        ]
+        self._populate_cache()
+
+        result = self.cache.get_recently_added(limit=1, library="movies")
+
+        assert [m.rating_key for m in result] == ["3"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_rebuilds_search_index(self):
+        self.mock_plex_client.get_all_media.return_value = self.test_media
+
+        await self.cache.refresh()
+
+        assert self.cache.item_count == 4
+        assert self.cache.is_stale is False
+        assert self.cache.search("interstellar")[0].rating_key == "4"
+        assert self.cache.get_libraries() == ["Movies", "TV Shows"]
+
+        self.mock_plex_client.get_all_media.return_value = self.test_media[:1]
+        await self.cache.refresh()
+
+        assert self.cache.search("interstellar") == []
+        assert self.cache.get_libraries() == ["TV Shows"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_builds_snapshot_off_the_event_loop(self, monkeypatch):
+        build_threads = []
+        snapshot_cls = cache_module._CacheSnapshot
+
+        def recording_snapshot(cache):
+            build_threads.append(threading.get_ident())
+            return snapshot_cls(cache)
+
+        monkeypatch.setattr(cache_module, "_CacheSnapshot", recording_snapshot)
+        self.mock_plex_client.get_all_media.return_value = self.test_media
+
+        await self.cache.refresh()
+
+        assert build_threads and build_threads[0] != threading.get_ident()
+        assert self.cache.item_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_fetch(self):
+        self.mock_plex_client.get_all_media.return_value = self.test_media
+
+        await asyncio.gather(self.cache.refresh(), self.cache.refresh())
+
+        assert self.mock_plex_client.get_all_media.call_count == 1
+        assert self.cache.item_count == 4
+        assert self.cache._refresh_inflight is None
+
+        await self.cache.refresh()
+        assert self.mock_plex_client.get_all_media.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_cache(self):
+        self._populate_cache()
+        previous_snapshot = self.cache._snapshot
+        self.mock_plex_client.get_all_media.side_effect = RuntimeError("plex down")
+
+        with pytest.raises(RuntimeError):
+            await self.cache.refresh()
+
+        assert self.cache._snapshot is previous_snapshot
+        assert self.cache.item_count == 4
+        assert self.cache.search("interstellar")[0].rating_key == "4"
+
     @pytest.mark.asyncio
     async def test_shutdown_cancels_background_refresh_task(self):
         self.mock_plex_client.get_all_media.return_value = []
@@ -183,3 +398,23 @@ class TestLibraryCache:
         assert self.cache._refresh_task is None
         assert refresh_task.done()
         assert refresh_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_backs_off_on_consecutive_failures(self, monkeypatch):
+        self.cache.refresh_minutes = 1
+        results = [RuntimeError("down"), RuntimeError("down"), None, RuntimeError("down")]
+        monkeypatch.setattr(self.cache, "refresh", AsyncMock(side_effect=results))
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+            if len(delays) == len(results):
+                raise asyncio.CancelledError
+
+        monkeypatch.setattr("discord_plex.cogs.plex.cache.asyncio.sleep", fake_sleep)
+
+        await self.cache.start_background_refresh()
+        with pytest.raises(asyncio.CancelledError):
+            await self.cache._refresh_task
+
+        assert [round(delay) for delay in delays] == [60, 120, 60, 60]
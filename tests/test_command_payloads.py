@@ -60,3 +60,11 @@ def test_registered_command_groups_fit_discord_size_limit():
 
     assert payload_sizes["plex"] < 8000
     assert payload_sizes["request"] < 8000
+
+
+def test_commands_route_errors_through_cog_handler():
+    """Errors go through cog_command_error rather than per-command handlers."""
+    assert PlexCog._get_overridden_method(PlexCog.cog_command_error) is not None
+    for group in (PlexCog.plex, PlexCog.request):
+        for command in group.subcommands:
+            assert not hasattr(command, "on_error"), command.name
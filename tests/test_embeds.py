@@ -5,6 +5,7 @@ from discord_plex.cogs.plex.embeds import (
     create_media_embed,
     create_recently_added_embed,
     create_request_embed,
+    create_server_stats_embed,
     create_stream_embed,
     create_success_embed,
     truncate,
@@ -89,10 +90,25 @@ class TestCreateRecentlyAddedEmbed:
         assert "Test Movie" in embed.description
         assert "3d ago" in embed.description
 
+    def test_added_today_and_yesterday(self):
+        media = [
+            self._media(datetime.now(UTC) - timedelta(hours=1)),
+            self._media(datetime.now() - timedelta(days=1, hours=1)),
+        ]
+        embed = create_recently_added_embed(media)
+        assert embed.description.splitlines()[0].endswith("• Today")
+        assert embed.description.splitlines()[1].endswith("• Yesterday")
+
     def test_no_recent_media(self):
         embed = create_recently_added_embed([], library="Movies")
         assert "No recent additions" in embed.description
 
+    def test_title_names_library_only_when_filtered(self):
+        assert create_recently_added_embed([], library="Movies").title == (
+            "📥 Recently Added to Movies"
+        )
+        assert create_recently_added_embed([]).title == "📥 Recently Added"
+
 
 class TestCreateStreamEmbed:
     def test_stream_embed(self):
@@ -114,6 +130,8 @@ class TestCreateStreamEmbed:
         embed = create_stream_embed(stream)
         assert "Now Playing" in embed.title
         assert "Interstellar" in embed.description
+        player = next(field for field in embed.fields if field.name == "Player")
+        assert player.value == "Living Room TV (Chromecast)"
 
 
 class TestCreateRequestEmbed:
@@ -135,6 +153,25 @@ class TestCreateRequestEmbed:
         assert embed.thumbnail is not None
 
 
+class TestCreateServerStatsEmbed:
+    def test_sections_limited_to_first_five_alphabetically(self):
+        stats = {
+            "total_items": 28,
+            "by_type": {"show": 10, "movie": 18},
+            "by_library": {
+                name: 4 for name in ["TV", "Anime", "Movies", "Kids", "4K", "Docs", "Music"]
+            },
+            "last_refresh": None,
+            "is_stale": False,
+        }
+
+        embed = create_server_stats_embed({}, stats)
+
+        fields = {field.name: field.value for field in embed.fields}
+        assert fields["Library"] == "Movie: 18\nShow: 10"
+        assert fields["By Section"] == "4K: 4\nAnime: 4\nDocs: 4\nKids: 4\nMovies: 4"
+
+
 class TestCreateErrorEmbed:
     def test_error_embed(self):
         embed = create_error_embed("Something went wrong")
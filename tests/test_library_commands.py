@@ -1,12 +1,24 @@
+import asyncio
+import contextlib
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from discord_plex.cogs.plex.library import plex_search, show_media_info
+from discord_plex.cogs.plex.library import (
+    _find_media,
+    plex_recent,
+    plex_search,
+    plex_stats,
+    show_media_info,
+)
 from discord_plex.cogs.plex.models import CachedMedia, MediaType
 from discord_plex.cogs.plex.views import MediaInfoView, MediaSelectView
 
+PLEX_WEB_URL = "https://app.plex.tv/desktop#!/server/server-1/details?key=%2Flibrary%2Fmetadata%2F"
+
 
 @pytest.fixture
 def media_item() -> CachedMedia:
@@ -30,7 +42,7 @@ async def test_show_media_info_sends_single_followup_with_media_view(media_item:
         ),
         plex_client=SimpleNamespace(
             get_thumb_url=Mock(return_value="https://plex/thumb.jpg"),
-            server=SimpleNamespace(machineIdentifier="server-1"),
+            get_web_url=Mock(side_effect=lambda key: f"{PLEX_WEB_URL}{key}"),
         ),
         logger=Mock(),
     )
@@ -44,10 +56,7 @@ async def test_show_media_info_sends_single_followup_with_media_view(media_item:
 
 
 @pytest.mark.asyncio
-async def test_plex_search_select_flow_uses_same_response_path(
-    media_item: CachedMedia,
-    monkeypatch: pytest.MonkeyPatch,
-):
+async def test_plex_search_select_edits_results_message(media_item: CachedMedia):
     second_item = CachedMedia(
         rating_key="2",
         title="Another Movie",
@@ -63,22 +72,277 @@ async def test_plex_search_select_flow_uses_same_response_path(
             is_stale=False,
             search=Mock(return_value=results),
         ),
-        plex_client=SimpleNamespace(search=Mock(return_value=[])),
+        overseerr_client=SimpleNamespace(get_poster_url=AsyncMock(return_value=None)),
+        plex_client=SimpleNamespace(
+            search=Mock(return_value=[]),
+            get_thumb_url=Mock(return_value="https://plex/thumb.jpg"),
+            get_web_url=Mock(side_effect=lambda key: f"{PLEX_WEB_URL}{key}"),
+        ),
+        logger=Mock(),
+        _search_inflight={},
     )
 
-    show_media_info_mock = AsyncMock()
-    monkeypatch.setattr("discord_plex.cogs.plex.library.show_media_info", show_media_info_mock)
-
     await plex_search(cog, ctx, "movie")
 
+    cog.cache.search.assert_called_once_with("movie", limit=20, media_type=None, library="")
     ctx.send_followup.assert_awaited_once()
     initial_view = ctx.send_followup.await_args.kwargs["view"]
     assert isinstance(initial_view, MediaSelectView)
+    assert ctx.send_followup.await_args.kwargs["embed"].description == (
+        "**1.** 🎬 Example Movie (2024)\n**2.** 🎬 Another Movie (2020)"
+    )
 
-    interaction = SimpleNamespace(response=SimpleNamespace(defer=AsyncMock()))
+    interaction = SimpleNamespace(
+        response=SimpleNamespace(defer=AsyncMock()), edit_original_response=AsyncMock()
+    )
     initial_view.select._selected_values = [second_item.rating_key]
     initial_view.select._interaction = SimpleNamespace(data={})
     await initial_view.select.callback(interaction)
 
-    interaction.response.defer.assert_awaited_once()
-    show_media_info_mock.assert_awaited_once_with(cog, ctx, second_item)
+    # The pick is acknowledged, then the results message is edited in place and
+    # keeps its picker
+    ctx.send_followup.assert_awaited_once()
+    interaction.response.defer.assert_awaited_once_with()
+    interaction.edit_original_response.assert_awaited_once()
+    kwargs = interaction.edit_original_response.await_args.kwargs
+    assert kwargs["embed"].title == "🎬 Another Movie (2020)"
+    assert kwargs["view"] is initial_view
+    link_buttons = [item for item in initial_view.children if getattr(item, "url", None)]
+    assert [button.url for button in link_buttons] == [f"{PLEX_WEB_URL}2"]
+
+
+@pytest.mark.asyncio
+async def test_plex_search_merges_direct_results_without_duplicates(
+    media_item: CachedMedia,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    direct_copy = CachedMedia(
+        rating_key="1",
+        title="Example Movie",
+        year=2024,
+        media_type=MediaType.MOVIE,
+        library="Movies",
+    )
+    direct_only = CachedMedia(
+        rating_key="3",
+        title="Example Movie 2",
+        year=2026,
+        media_type=MediaType.MOVIE,
+        library="Movies",
+    )
+
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(is_stale=False, search=Mock(return_value=[media_item])),
+        plex_client=SimpleNamespace(search=Mock(return_value=[direct_copy, direct_only])),
+        _search_inflight={},
+    )
+
+    await plex_search(cog, ctx, "example")
+
+    view = ctx.send_followup.await_args.kwargs["view"]
+    assert isinstance(view, MediaSelectView)
+    assert [media.rating_key for media in view.media_items] == ["1", "3"]
+    assert view.media_items[0] is media_item
+
+
+@pytest.mark.asyncio
+async def test_plex_search_uses_direct_search_started_during_refresh(media_item: CachedMedia):
+    direct_item = CachedMedia(
+        rating_key="3",
+        title="Example Movie 2",
+        year=2026,
+        media_type=MediaType.MOVIE,
+        library="Movies",
+    )
+
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(
+            is_stale=True,
+            refresh=AsyncMock(),
+            search=Mock(return_value=[media_item]),
+        ),
+        plex_client=SimpleNamespace(search=Mock(return_value=[direct_item])),
+        _search_inflight={},
+    )
+
+    await plex_search(cog, ctx, "example")
+
+    cog.cache.refresh.assert_awaited_once()
+    cog.plex_client.search.assert_called_once_with("example", limit=10)
+    view = ctx.send_followup.await_args.kwargs["view"]
+    assert [media.rating_key for media in view.media_items] == ["1", "3"]
+
+
+@pytest.mark.asyncio
+async def test_find_media_cancels_direct_search_when_cancelled_during_refresh():
+    release = threading.Event()
+    refresh_started = asyncio.Event()
+
+    async def slow_refresh():
+        refresh_started.set()
+        await asyncio.sleep(10)
+
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(is_stale=True, refresh=slow_refresh, search=Mock()),
+        plex_client=SimpleNamespace(search=Mock(side_effect=lambda *_, **__: release.wait(5))),
+    )
+
+    before = asyncio.all_tasks()
+    find_task = asyncio.create_task(_find_media(cog, "example", None, ""))
+    await refresh_started.wait()
+    (direct_task,) = asyncio.all_tasks() - before - {find_task}
+
+    find_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await find_task
+    release.set()
+
+    with contextlib.suppress(asyncio.CancelledError):
+        await direct_task
+    assert direct_task.cancelled()
+    cog.cache.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_plex_search_drops_direct_search_when_cache_has_enough(media_item: CachedMedia):
+    cached = [
+        CachedMedia(
+            rating_key=str(key),
+            title=f"Example Movie {key}",
+            year=2024,
+            media_type=MediaType.MOVIE,
+            library="Movies",
+        )
+        for key in range(5)
+    ]
+
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(is_stale=True, refresh=AsyncMock(), search=Mock(return_value=cached)),
+        plex_client=SimpleNamespace(search=Mock(return_value=[media_item])),
+        _search_inflight={},
+    )
+
+    await plex_search(cog, ctx, "example")
+
+    view = ctx.send_followup.await_args.kwargs["view"]
+    assert [media.rating_key for media in view.media_items] == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_plex_recent_serves_snapshot_until_it_expires(media_item: CachedMedia):
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        plex_client=SimpleNamespace(get_recently_added=Mock(return_value=[media_item])),
+        _snapshots={},
+        _snapshot_refreshes={},
+    )
+
+    await plex_recent(cog, ctx, "Movies", 5)
+    await plex_recent(cog, ctx, "movies", 5)
+
+    cog.plex_client.get_recently_added.assert_called_once_with("Movies", 5)
+    assert ctx.send_followup.await_count == 2
+
+    # An expired snapshot is still served while a background task refreshes it
+    key = ("recent", "movies", 5)
+    cog._snapshots[key] = ([], time.monotonic() - 1)
+    await plex_recent(cog, ctx, "Movies", 5)
+    await asyncio.gather(*cog._snapshot_refreshes.values())
+
+    assert cog.plex_client.get_recently_added.call_count == 2
+    assert cog._snapshots[key][0] == [media_item]
+    assert cog._snapshot_refreshes == {}
+
+
+@pytest.mark.asyncio
+async def test_plex_recent_refetches_snapshot_past_grace_window(media_item: CachedMedia):
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        plex_client=SimpleNamespace(get_recently_added=Mock(return_value=[media_item])),
+        _snapshots={("recent", "movies", 5): ([], 0.0)},
+        _snapshot_refreshes={},
+    )
+
+    await plex_recent(cog, ctx, "Movies", 5)
+
+    cog.plex_client.get_recently_added.assert_called_once_with("Movies", 5)
+    assert cog._snapshot_refreshes == {}
+    assert cog._snapshots[("recent", "movies", 5)][0] == [media_item]
+
+
+@pytest.mark.asyncio
+async def test_plex_stats_does_not_keep_failed_server_info():
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(
+            get_stats=Mock(
+                return_value={
+                    "total_items": 0,
+                    "by_type": {},
+                    "by_library": {},
+                    "last_refresh": None,
+                    "is_stale": True,
+                }
+            )
+        ),
+        plex_client=SimpleNamespace(get_server_info=Mock(return_value={})),
+        _snapshots={},
+        _snapshot_refreshes={},
+    )
+
+    await plex_stats(cog, ctx)
+
+    assert cog._snapshots == {}
+    ctx.send_followup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_plex_search_coalesces_identical_concurrent_searches(media_item: CachedMedia):
+    second_item = CachedMedia(
+        rating_key="2",
+        title="Another Example",
+        year=2020,
+        media_type=MediaType.MOVIE,
+        library="Movies",
+    )
+    first_ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    second_ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(is_stale=False, search=Mock(return_value=[media_item, second_item])),
+        plex_client=SimpleNamespace(search=Mock(return_value=[])),
+        _search_inflight={},
+    )
+
+    await asyncio.gather(
+        plex_search(cog, first_ctx, "Example"),
+        plex_search(cog, second_ctx, "example "),
+    )
+
+    cog.cache.search.assert_called_once()
+    cog.plex_client.search.assert_called_once()
+    first_ctx.send_followup.assert_awaited_once()
+    second_ctx.send_followup.assert_awaited_once()
+    assert cog._search_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_plex_search_reports_refresh_failure():
+    ctx = SimpleNamespace(defer=AsyncMock(), send_followup=AsyncMock())
+    cog = SimpleNamespace(
+        cache=SimpleNamespace(
+            is_stale=True,
+            refresh=AsyncMock(side_effect=RuntimeError("plex down")),
+            search=Mock(),
+        ),
+        plex_client=SimpleNamespace(search=Mock(return_value=[])),
+        _search_inflight={},
+    )
+
+    await plex_search(cog, ctx, "example")
+
+    embed = ctx.send_followup.await_args.kwargs["embed"]
+    assert "Failed to refresh cache: plex down" in embed.description
+    cog.cache.search.assert_not_called()
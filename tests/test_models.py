@@ -1,8 +1,12 @@
+from datetime import UTC, datetime
+
 from discord_plex.cogs.plex.models import (
     ActiveStream,
     CachedMedia,
     MediaType,
+    OverseerrRequest,
     OverseerrSearchResult,
+    RequestStatus,
 )
 
 
@@ -113,6 +117,37 @@ class TestCachedMedia:
         assert media.tmdb_id is None
         assert media.imdb_id is None
 
+    def test_added_ts_from_added_at(self):
+        media = CachedMedia(
+            rating_key="123",
+            title="Test",
+            year=2024,
+            media_type=MediaType.MOVIE,
+            library="Movies",
+            added_at=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+        assert media.added_ts == 1704067200
+
+    def test_uses_slots(self):
+        media = CachedMedia(
+            rating_key="123",
+            title="Test",
+            year=2024,
+            media_type=MediaType.MOVIE,
+            library="Movies",
+        )
+        assert not hasattr(media, "__dict__")
+
+    def test_added_ts_missing_added_at(self):
+        media = CachedMedia(
+            rating_key="123",
+            title="Test",
+            year=2024,
+            media_type=MediaType.MOVIE,
+            library="Movies",
+        )
+        assert media.added_ts == -1
+
 
 class TestActiveStream:
     def test_progress_bar(self):
@@ -133,6 +168,11 @@ class TestActiveStream:
         )
         assert stream.progress_bar == "█████░░░░░"
 
+        stream.progress_percent = 100.0
+        assert stream.progress_bar == "██████████"
+        stream.progress_percent = 104.0  # Plex can report slightly past the end
+        assert stream.progress_bar == "██████████"
+
     def test_progress_formatted(self):
         stream = ActiveStream(
             session_key="1",
@@ -170,6 +210,25 @@ class TestActiveStream:
         assert stream.state_emoji == "⏸️"
 
 
+class TestOverseerrRequest:
+    def _request(self, status: RequestStatus) -> OverseerrRequest:
+        return OverseerrRequest(
+            request_id=1,
+            media_type="movie",
+            tmdb_id=123,
+            title="Test",
+            year=2024,
+            status=status,
+            requested_by="user",
+            requested_at=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+    def test_status_emoji(self):
+        assert self._request(RequestStatus.PENDING).status_emoji == "⏳"
+        assert self._request(RequestStatus.AVAILABLE).status_emoji == "🎉"
+        assert self._request(RequestStatus.UNKNOWN).status_emoji == "❓"
+
+
 class TestOverseerrSearchResult:
     def test_poster_url(self):
         result = OverseerrSearchResult(
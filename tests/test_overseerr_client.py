@@ -1,106 +1,136 @@
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from discord_plex.cogs.plex.models import RequestStatus
 from discord_plex.cogs.plex.overseerr_client import OverseerrClient
 
+# Shared canned payloads; tests must not mutate them
+_BASE_URL = "http://test:5055"
+_POSTER_URL = "https://image.tmdb.org/t/p/w500/abc123.jpg"
+
+_SEASONS_DETAILS = {
+    "seasons": [
+        {"seasonNumber": 0, "episodeCount": 5},
+        {"seasonNumber": 1, "episodeCount": 12},
+        {"seasonNumber": 2, "episodeCount": 10},
+    ]
+}
+
+_TV_REQUEST_RESPONSE = {
+    "id": 1,
+    "type": "tv",
+    "media": {"tmdbId": 12345},
+    "status": 1,
+    "requestedBy": {"displayName": "test"},
+    "createdAt": "2024-01-01T00:00:00Z",
+}
+
+
+def _make_client() -> OverseerrClient:
+    return OverseerrClient(_BASE_URL, "test-api-key")
+
 
 class TestOverseerrClient:
     """Tests for OverseerrClient methods."""
 
-    async def test_get_poster_url_with_poster(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        client.get_media_details = AsyncMock(return_value={"posterPath": "/abc123.jpg"})
-
-        result = await client.get_poster_url("movie", 12345)
-        assert result == "https://image.tmdb.org/t/p/w500/abc123.jpg"
-        await client.close()
+    @staticmethod
+    def _client_with_details(details: dict | None) -> OverseerrClient:
+        client = _make_client()
+        client.get_media_details = AsyncMock(return_value=details)
+        return client
 
-    async def test_get_poster_url_no_poster(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        client.get_media_details = AsyncMock(return_value={"posterPath": None})
+    async def test_session_uses_pooled_connector_and_timeout(self):
+        client = _make_client()
+        session = await client._get_session()
 
-        result = await client.get_poster_url("movie", 12345)
-        assert result is None
+        assert session.timeout.total == 15
+        assert session.timeout.connect == 5
+        assert session.connector.limit_per_host == 16
+        assert await client._get_session() is session
         await client.close()
 
-    async def test_get_poster_url_no_details(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        client.get_media_details = AsyncMock(return_value=None)
+    def test_convert_status(self):
+        assert OverseerrClient._convert_status(1) == RequestStatus.PENDING
+        assert OverseerrClient._convert_status(5) == RequestStatus.AVAILABLE
+        assert OverseerrClient._convert_status(0) == RequestStatus.UNKNOWN
+        assert OverseerrClient._convert_status(None) == RequestStatus.UNKNOWN
 
-        result = await client.get_poster_url("movie", 12345)
-        assert result is None
-        await client.close()
+    @pytest.mark.parametrize(
+        ("details", "expected"),
+        [
+            ({"posterPath": "/abc123.jpg"}, _POSTER_URL),
+            ({"posterPath": None}, None),
+            (None, None),
+        ],
+        ids=["with_poster", "no_poster", "no_details"],
+    )
+    async def test_get_poster_url(self, details, expected):
+        client = self._client_with_details(details)
+        assert await client.get_poster_url("movie", 12345) == expected
 
-    async def test_get_available_seasons(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        client.get_media_details = AsyncMock(
-            return_value={
-                "seasons": [
-                    {"seasonNumber": 0, "episodeCount": 5},
-                    {"seasonNumber": 1, "episodeCount": 12},
-                    {"seasonNumber": 2, "episodeCount": 10},
-                ]
-            }
-        )
+    async def test_get_poster_url_caches_lookups(self):
+        client = self._client_with_details({"posterPath": "/abc123.jpg"})
 
-        result = await client._get_available_seasons(12345)
-        assert result == [1, 2]
-        await client.close()
+        first = await client.get_poster_url("movie", 12345)
+        second = await client.get_poster_url("movie", 12345)
 
-    async def test_get_available_seasons_empty(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        client.get_media_details = AsyncMock(return_value=None)
+        assert first == second == _POSTER_URL
+        client.get_media_details.assert_awaited_once_with("movie", 12345)
 
-        result = await client._get_available_seasons(12345)
-        assert result == []
-        await client.close()
+    async def test_get_poster_url_expired_entry_refetches(self):
+        client = self._client_with_details({"posterPath": "/abc123.jpg"})
 
-    async def test_create_request_with_seasons(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        request_calls = []
+        await client.get_poster_url("movie", 12345)
+        client._poster_cache[("movie", 12345)] = ("stale", 0.0)
+        result = await client.get_poster_url("movie", 12345)
 
-        async def mock_request(method, endpoint, json=None):
-            request_calls.append({"method": method, "endpoint": endpoint, "json": json})
-            return {
-                "id": 1,
-                "type": "tv",
-                "media": {"tmdbId": 12345},
-                "status": 1,
-                "requestedBy": {"displayName": "test"},
-                "createdAt": "2024-01-01T00:00:00Z",
-            }
+        assert result == _POSTER_URL
+        assert client.get_media_details.await_count == 2
 
-        client._request = mock_request
-        await client.create_request("tv", 12345, seasons=[1, 2])
+    async def test_get_poster_url_does_not_cache_failures(self):
+        client = _make_client()
+        client.get_media_details = AsyncMock(side_effect=[None, {"posterPath": "/abc123.jpg"}])
 
-        assert len(request_calls) == 1
-        assert request_calls[0]["json"]["seasons"] == [1, 2]
-        await client.close()
+        assert await client.get_poster_url("movie", 12345) is None
+        result = await client.get_poster_url("movie", 12345)
 
-    async def test_create_request_auto_fetches_seasons(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
-        client._get_available_seasons = AsyncMock(return_value=[1, 2, 3])
-        request_calls = []
+        assert result == _POSTER_URL
 
-        async def mock_request(method, endpoint, json=None):
-            request_calls.append({"method": method, "endpoint": endpoint, "json": json})
-            return {
-                "id": 1,
-                "type": "tv",
-                "media": {"tmdbId": 12345},
-                "status": 1,
-                "requestedBy": {"displayName": "test"},
-                "createdAt": "2024-01-01T00:00:00Z",
-            }
+    @pytest.mark.parametrize(
+        ("details", "expected"),
+        [
+            (_SEASONS_DETAILS, [1, 2]),
+            (None, []),
+        ],
+        ids=["skips_specials", "no_details"],
+    )
+    async def test_get_available_seasons(self, details, expected):
+        client = self._client_with_details(details)
+        assert await client._get_available_seasons(12345) == expected
 
-        client._request = mock_request
-        await client.create_request("tv", 12345)
+    @pytest.mark.parametrize(
+        ("seasons", "expected"),
+        [([1, 2], [1, 2]), (None, [1, 2, 3])],
+        ids=["explicit_seasons", "auto_fetched_seasons"],
+    )
+    async def test_create_request_seasons(self, seasons, expected):
+        client = _make_client()
+        client._get_available_seasons = AsyncMock(return_value=[1, 2, 3])
+        client._request = AsyncMock(return_value=_TV_REQUEST_RESPONSE)
+        await client.create_request("tv", 12345, seasons=seasons)
 
-        client._get_available_seasons.assert_called_once_with(12345)
-        assert request_calls[0]["json"]["seasons"] == [1, 2, 3]
-        await client.close()
+        if seasons is None:
+            client._get_available_seasons.assert_awaited_once_with(12345)
+        else:
+            client._get_available_seasons.assert_not_awaited()
+        client._request.assert_awaited_once()
+        assert client._request.await_args.kwargs["json"]["seasons"] == expected
 
     async def test_search_passes_raw_query_to_request_params(self):
-        client = OverseerrClient("http://test:5055", "test-api-key")
+        client = _make_client()
         request_calls = []
         raw_query = "Star Wars: A New Hope + Special"
 
@@ -115,4 +145,119 @@ class TestOverseerrClient:
 
         assert len(request_calls) == 1
         assert request_calls[0]["params"] == {"query": raw_query, "page": 3}
-        await client.close()
+
+    async def test_get_users_fetches_remaining_pages(self):
+        client = _make_client()
+        skips = []
+
+        async def mock_request(method, endpoint, json=None, params=None):
+            skips.append(params["skip"])
+            return {"pageInfo": {"pages": 3}, "results": [{"id": params["skip"]}]}
+
+        client._request = mock_request
+        users = await client.get_users()
+
+        assert sorted(skips) == [0, 100, 200]
+        assert [user["id"] for user in users] == [0, 100, 200]
+
+    async def test_get_user_requests_for_user_reads_every_page(self):
+        client = _make_client()
+        pages = {
+            0: {"pageInfo": {"pages": 2}, "results": [self._request_payload(1, "alice")]},
+            100: {"pageInfo": {"pages": 2}, "results": [self._request_payload(2, "bob 42")]},
+        }
+
+        async def mock_request(method, endpoint, json=None, params=None):
+            return pages[params["skip"]]
+
+        client._request = mock_request
+        requests = await client.get_user_requests(user_id=42)
+
+        assert [request.request_id for request in requests] == [2]
+
+    async def test_get_user_requests_without_user_reads_first_page(self):
+        client = _make_client()
+        request_calls = []
+
+        async def mock_request(method, endpoint, json=None, params=None):
+            request_calls.append(params)
+            return {"pageInfo": {"pages": 5}, "results": [self._request_payload(1, "alice")]}
+
+        client._request = mock_request
+        requests = await client.get_user_requests(status="pending")
+
+        assert request_calls == [{"filter": "pending"}]
+        assert [request.request_id for request in requests] == [1]
+
+    @staticmethod
+    def _request_payload(request_id: int, display_name: str) -> dict:
+        return {
+            "id": request_id,
+            "status": 1,
+            "media": {"mediaType": "movie", "tmdbId": request_id},
+            "requestedBy": {"displayName": display_name},
+        }
+
+    async def test_search_primes_poster_cache(self):
+        client = _make_client()
+
+        async def mock_request(method, endpoint, json=None, params=None):
+            return {
+                "results": [
+                    {"mediaType": "tv", "id": 1399, "name": "Show", "posterPath": "/show.jpg"}
+                ]
+            }
+
+        client._request = mock_request
+        client.get_media_details = AsyncMock()
+        await client.search("show")
+
+        assert await client.get_poster_url("tv", 1399) == "https://image.tmdb.org/t/p/w500/show.jpg"
+        client.get_media_details.assert_not_awaited()
+
+    @staticmethod
+    def _client_with_response(status: int, body: dict | None = None) -> OverseerrClient:
+        client = _make_client()
+        response = SimpleNamespace(
+            status=status,
+            json=AsyncMock(return_value=body),
+            text=AsyncMock(return_value="error"),
+        )
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=response)
+        request_context.__aexit__ = AsyncMock(return_value=False)
+        client._session = MagicMock(closed=False)
+        client._session.request = MagicMock(return_value=request_context)
+        return client
+
+    async def test_request_accepts_any_2xx(self):
+        client = self._client_with_response(202, {"ok": True})
+        assert await client._request("POST", "/request/1/approve") == {"ok": True}
+
+    async def test_request_error_status_returns_none(self):
+        client = self._client_with_response(500)
+        assert await client._request("GET", "/status") is None
+
+    async def test_delete_request_succeeds_on_no_content(self):
+        client = self._client_with_response(204)
+        assert await client.delete_request(7) is True
+        client._session.request.assert_called_once_with(
+            "DELETE", f"{_BASE_URL}/api/v1/request/7", json=None, params=None
+        )
+
+    async def test_delete_request_fails_on_not_found(self):
+        client = self._client_with_response(404)
+        assert await client.delete_request(7) is False
+
+    def test_parse_request_reads_media_and_utc_timestamp(self):
+        client = _make_client()
+        payload = self._request_payload(9, "alice")
+        payload["createdAt"] = "2024-05-01T12:30:00.000Z"
+        payload["media"].update({"title": "Dune", "releaseDate": "2021-10-22"})
+
+        request = client._parse_request(payload)
+
+        assert request is not None
+        assert (request.request_id, request.title, request.year) == (9, "Dune", 2021)
+        assert request.requested_at == datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+        assert request.requested_by == "alice"
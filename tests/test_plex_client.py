@@ -29,6 +29,31 @@ class TestPlexClientWrapperInit:
         client.reconnect()
         assert client._server is None
 
+    def test_server_reuses_pooled_session(self, monkeypatch):
+        from discord_plex.cogs.plex import plex_client
+
+        plex_server = MagicMock()
+        monkeypatch.setattr(plex_client, "PlexServer", plex_server)
+        client = self._make_client()
+        session = client._session
+
+        assert client.server is plex_server.return_value
+        client.reconnect()
+        assert client.server is plex_server.return_value
+
+        assert plex_server.call_count == 2
+        for call in plex_server.call_args_list:
+            assert call.kwargs["session"] is session
+        assert session.get_adapter("http://plex").poolmanager.connection_pool_kw["maxsize"] == 16
+
+    def test_close_releases_session(self):
+        client = self._make_client()
+        client._server = MagicMock()
+        client._session = MagicMock()
+        client.close()
+        assert client._server is None
+        client._session.close.assert_called_once_with()
+
 
 class TestGetThumbUrl:
     def _make_client(self):
@@ -50,6 +75,28 @@ class TestGetThumbUrl:
         assert client.get_thumb_url("") is None
 
 
+class TestGetWebUrl:
+    def _make_client(self):
+        from discord_plex.cogs.plex.plex_client import PlexClientWrapper
+
+        client = PlexClientWrapper("http://plex:32400", "tok123")
+        client._server = MagicMock(machineIdentifier="server-1")
+        return client
+
+    def test_returns_plex_web_url(self):
+        client = self._make_client()
+        assert client.get_web_url("42") == (
+            "https://app.plex.tv/desktop#!/server/server-1/details?key=%2Flibrary%2Fmetadata%2F42"
+        )
+
+    def test_reconnect_rebuilds_prefix(self):
+        client = self._make_client()
+        client.get_web_url("42")
+        client.reconnect()
+        client._server = MagicMock(machineIdentifier="server-2")
+        assert client.get_web_url("42").startswith("https://app.plex.tv/desktop#!/server/server-2/")
+
+
 class TestGetMediaType:
     def _get_media_type(self, plex_type):
         from discord_plex.cogs.plex.plex_client import PlexClientWrapper
@@ -198,6 +245,25 @@ class TestConvertToCachedMedia:
         assert result.episode_count is None
         assert result.season_count is None
 
+    def test_converts_artist_without_year_or_duration(self):
+        client = self._make_client()
+        item = MagicMock(
+            spec=["type", "ratingKey", "title", "thumb", "summary", "rating", "addedAt", "guids"],
+            type="artist",
+            ratingKey=7,
+            thumb=None,
+            summary=None,
+            rating=None,
+            addedAt=None,
+            guids=[],
+        )
+        item.title = "Band"
+        result = client._convert_to_cached_media(item, "Music")
+        assert result is not None
+        assert result.media_type == MediaType.ARTIST
+        assert result.year is None
+        assert result.duration is None
+
     def test_unknown_type_returns_none(self):
         client = self._make_client()
         item = self._make_plex_item(type="photo")
@@ -252,6 +318,7 @@ class TestGetAllMedia:
         result = client.get_all_media()
         assert len(result) == 1
         assert result[0].title == "Movie"
+        assert movie_item._autoReload is False
 
     def test_skips_unsupported_sections(self):
         client = self._make_client_with_server()
@@ -269,6 +336,30 @@ class TestGetAllMedia:
         with pytest.raises(RuntimeError):
             client.get_all_media()
 
+    def test_keeps_section_order_across_concurrent_scans(self):
+        client = self._make_client_with_server()
+        sections = []
+        for title in ("Movies", "TV", "Music"):
+            item = MagicMock(type="movie", ratingKey=title, year=None, guids=[])
+            item.title = title
+            section = MagicMock(type="movie")
+            section.title = title
+            section.all.return_value = [item]
+            sections.append(section)
+        client._server.library.sections.return_value = sections
+
+        result = client.get_all_media()
+
+        assert [media.library for media in result] == ["Movies", "TV", "Music"]
+
+    def test_section_error_raises(self):
+        client = self._make_client_with_server()
+        section = MagicMock(type="show")
+        section.all.side_effect = RuntimeError("section failed")
+        client._server.library.sections.return_value = [section]
+        with pytest.raises(RuntimeError, match="section failed"):
+            client.get_all_media()
+
 
 class TestSearch:
     def _make_client_with_server(self):
@@ -430,6 +521,16 @@ class TestGetActiveStreams:
         result = client.get_active_streams()
         assert result[0].transcode_decision == "Transcode"
 
+    def test_unknown_resolution_falls_back_to_video_decision(self):
+        client = self._make_client_with_server()
+        transcode = MagicMock()
+        transcode.videoDecision = "transcode"
+        session = self._make_session(transcodeSessions=[transcode], videoResolution=None)
+        client._server.sessions.return_value = [session]
+
+        result = client.get_active_streams()
+        assert result[0].quality == "transcode"
+
     def test_direct_play(self):
         client = self._make_client_with_server()
         session = self._make_session()
@@ -454,6 +555,18 @@ class TestGetActiveStreams:
         result = client.get_active_streams()
         assert result[0].quality == "1080p"
 
+    @pytest.mark.parametrize(
+        ("resolution", "expected"),
+        [("1080", "1080p"), ("4k", "4K"), ("sd", "SD"), ("1440", "1440p"), ("other", "other")],
+    )
+    def test_resolution_labels(self, resolution, expected):
+        client = self._make_client_with_server()
+        session = self._make_session(videoResolution=resolution)
+        client._server.sessions.return_value = [session]
+
+        result = client.get_active_streams()
+        assert result[0].quality == expected
+
     def test_empty_sessions(self):
         client = self._make_client_with_server()
         client._server.sessions.return_value = []
@@ -505,10 +618,14 @@ class TestGetRecentlyAdded:
     def test_all_libraries(self):
         client = self._make_client_with_server()
         items = [self._make_item(f"Item {i}") for i in range(3)]
-        client._server.library.recentlyAdded.return_value = items
+        client._server.library.fetchItems.return_value = items
 
         result = client.get_recently_added(limit=3)
         assert len(result) == 3
+        client._server.library.fetchItems.assert_called_once_with(
+            "/library/recentlyAdded", maxresults=3, params={"includeGuids": 1}
+        )
+        assert all(item._autoReload is False for item in items)
 
     def test_library_name_case_insensitive(self):
         client = self._make_client_with_server()
@@ -551,6 +668,37 @@ class TestGetLibraries:
         result = client.get_libraries()
         assert result == []
 
+    def test_reuses_sections_until_ttl_expires(self, monkeypatch):
+        from discord_plex.cogs.plex import plex_client
+
+        client = self._make_client_with_server()
+        section = MagicMock()
+        section.title = "Movies"
+        client._server.library.sections.return_value = [section]
+        clock = iter([100.0, 130.0, 161.0])
+        monkeypatch.setattr(plex_client, "time", MagicMock(monotonic=lambda: next(clock)))
+
+        client.get_libraries()
+        client.get_libraries()
+        assert client._server.library.sections.call_count == 1
+
+        client.get_libraries()
+        assert client._server.library.sections.call_count == 2
+
+    def test_reconnect_drops_cached_sections(self):
+        client = self._make_client_with_server()
+        section = MagicMock()
+        section.title = "Movies"
+        client._server.library.sections.return_value = [section]
+
+        client.get_libraries()
+        server = client._server
+        client.reconnect()
+        client._server = server
+        client.get_libraries()
+
+        assert server.library.sections.call_count == 2
+
 
 class TestGetAvailableClients:
     def _make_client_with_server(self):
@@ -622,8 +770,10 @@ class TestGetServerInfo:
         client._server.friendlyName = "My Plex"
         client._server.version = "1.32.0"
         client._server.platform = "Linux"
-        client._server.transcodeSessions.return_value = [MagicMock()]
-        client._server.sessions.return_value = [MagicMock(), MagicMock()]
+        client._server.sessions.return_value = [
+            MagicMock(transcodeSessions=[MagicMock()]),
+            MagicMock(transcodeSessions=[]),
+        ]
 
         result = client.get_server_info()
         assert result["name"] == "My Plex"
@@ -631,13 +781,23 @@ class TestGetServerInfo:
         assert result["platform"] == "Linux"
         assert result["transcodes"] == 1
         assert result["streams"] == 2
+        client._server.transcodeSessions.assert_not_called()
 
     def test_error_returns_empty_dict(self):
         client = self._make_client_with_server()
-        client._server.transcodeSessions.side_effect = RuntimeError("fail")
+        client._server.sessions.side_effect = RuntimeError("fail")
         result = client.get_server_info()
         assert result == {}
 
+    def test_shares_recent_sessions_with_active_streams(self):
+        client = self._make_client_with_server()
+        client._server.sessions.return_value = []
+
+        client.get_active_streams()
+        client.get_server_info()
+
+        client._server.sessions.assert_called_once_with()
+
 
 class TestGetLibraryForItem:
     def _make_client(self):
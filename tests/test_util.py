@@ -1,4 +1,15 @@
-from discord_plex.util import chunk_text, format_duration, format_size, truncate_text
+import asyncio
+
+import pytest
+
+from discord_plex.util import (
+    chunk_text,
+    coalesce,
+    format_duration,
+    format_size,
+    format_year_suffix,
+    truncate_text,
+)
 
 
 class TestChunkText:
@@ -36,6 +47,11 @@ class TestChunkText:
         for word in ["aaa", "bbb", "ccc", "ddd", "eee", "fff"]:
             assert word in joined
 
+    def test_skips_whitespace_between_chunks(self):
+        text = "alpha beta\n \n\tgamma delta   "
+        result = chunk_text(text, chunk_size=12)
+        assert result == ["alpha beta", "gamma delta"]
+
     def test_empty_string(self):
         result = chunk_text("")
         assert result == [""]
@@ -87,6 +103,14 @@ class TestFormatDuration:
         assert format_duration(5000) == "0:05"
 
 
+class TestFormatYearSuffix:
+    def test_known_year(self):
+        assert format_year_suffix(2021) == " (2021)"
+
+    def test_unknown_year(self):
+        assert format_year_suffix(None) == ""
+
+
 class TestFormatSize:
     def test_bytes(self):
         assert format_size(500) == "500.0 B"
@@ -111,3 +135,48 @@ class TestFormatSize:
 
     def test_zero(self):
         assert format_size(0) == "0.0 B"
+
+    def test_just_below_unit_boundary_stays_in_smaller_unit(self):
+        assert format_size(1048575) == "1024.0 KB"
+
+    def test_beyond_petabytes_stays_in_petabytes(self):
+        assert format_size(2048 * 1125899906842624) == "2048.0 PB"
+
+
+class TestCoalesce:
+    async def test_concurrent_callers_share_one_call(self):
+        inflight: dict = {}
+        calls = 0
+
+        async def work() -> list[int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return [1, 2]
+
+        first, second = await asyncio.gather(
+            coalesce(inflight, "key", work),
+            coalesce(inflight, "key", work),
+        )
+
+        assert first == second == [1, 2]
+        assert calls == 1
+        assert inflight == {}
+
+    async def test_exception_reaches_every_caller_and_clears_entry(self):
+        inflight: dict = {}
+
+        async def fail() -> None:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            coalesce(inflight, "key", fail),
+            coalesce(inflight, "key", fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert inflight == {}
+        with pytest.raises(RuntimeError):
+            await coalesce(inflight, "key", fail)